@@ -27,7 +27,7 @@ from PyQt5.QtWidgets import (
     QWidget, QPushButton, QTabWidget, QFrame, QSizePolicy,
     QGraphicsOpacityEffect
 )
-from PyQt5.QtCore import Qt, QFile, QTextStream, QTimer, QPoint, QEvent
+from PyQt5.QtCore import Qt, QFile, QTimer, QPoint, QEvent
 from PyQt5.QtCore import QPropertyAnimation
 from PyQt5.QtGui import QCursor, QFont
 
@@ -473,6 +473,8 @@ class KioskMainWindow(QMainWindow):
             gain_lna=default_band.gain_lna,
             gain_vga=default_band.gain_vga,
             fft_size=default_band.fft_size,
+            cpu_core=self._config.sdr.fft_cpu_core,
+            fft_window=self._config.waterfall.fft_window,
         )
 
         self._sdr_manager.new_waterfall_row.connect(self._on_waterfall_row)
@@ -490,6 +492,8 @@ class KioskMainWindow(QMainWindow):
         self._sdr_manager.connection_changed.connect(self._on_sdr_connection_changed)
         self._sdr_manager.running_changed.connect(lambda _: self._update_button_states())
         self._update_button_states()
+        # Enumerate USB on the thread pool; connection_changed reports the result
+        self._sdr_manager.probe_async()
         
         # Connect SDR manager to ISM view for signal detection
         if self._ism_view is not None:
@@ -1090,6 +1094,7 @@ class KioskMainWindow(QMainWindow):
                 self._config.sdr.gain_lna,
                 self._config.sdr.gain_vga,
             )
+            self._sdr_manager.set_fft_window(self._config.waterfall.fft_window)
 
         for waterfall in self._waterfalls.values():
             waterfall.set_colormap(self._config.waterfall.colormap)
@@ -1490,14 +1495,39 @@ class KioskMainWindow(QMainWindow):
             self._waterfalls[self._active_tab].center_on_frequency(freq_hz)
 
 
+_applied_qss_key = None
+
+
 def load_stylesheet(app, path):
-    """Load and apply a QSS stylesheet from the given file path."""
+    """Load and apply a QSS stylesheet from the given file path.
+
+    Skips the read and restyle entirely if the file is unchanged since the
+    last call that applied it.
+    """
+    global _applied_qss_key
+    try:
+        key = (path, os.stat(path).st_mtime)
+    except OSError:
+        return
+    if key == _applied_qss_key and app.styleSheet():
+        return
+
     qss_file = QFile(path)
-    if qss_file.open(QFile.ReadOnly | QFile.Text):
-        stream = QTextStream(qss_file)
-        stylesheet = stream.readAll()
+    if qss_file.open(QFile.ReadOnly):
+        # Map the file and decode the UTF-8 directly rather than going
+        # through QTextStream's codec detection.
+        size = qss_file.size()
+        mapped = qss_file.map(0, size) if size else None
+        if mapped is not None:
+            stylesheet = mapped.asstring(size).decode("utf-8")
+            qss_file.unmap(mapped)
+        else:
+            stylesheet = bytes(qss_file.readAll()).decode("utf-8")
         qss_file.close()
-        app.setStyleSheet(stylesheet)
+        # Re-applying an identical stylesheet still forces a full restyle
+        if stylesheet != app.styleSheet():
+            app.setStyleSheet(stylesheet)
+        _applied_qss_key = key
 
 
 def main():
@@ -18,6 +18,9 @@ import sys
 import os
 import ast
 import importlib
+import importlib.util
+import py_compile
+import re
 import traceback
 
 # Ensure we're in the right directory
@@ -25,6 +28,28 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, BASE_DIR)
 os.chdir(BASE_DIR)
 
+# Theme stylesheet, cached by mtime and reused by the UI checks
+_THEME_QSS_PATH = os.path.join(BASE_DIR, "config", "theme.qss")
+_THEME_QSS = ""
+_THEME_QSS_MTIME = None
+
+
+def _load_theme_qss():
+    """Return theme.qss text, re-reading it only when its mtime changes."""
+    global _THEME_QSS, _THEME_QSS_MTIME
+    try:
+        mtime = os.stat(_THEME_QSS_PATH).st_mtime
+    except OSError:
+        return ""
+    if mtime != _THEME_QSS_MTIME:
+        with open(_THEME_QSS_PATH, 'r', encoding='utf-8') as f:
+            _THEME_QSS = f.read()
+        _THEME_QSS_MTIME = mtime
+    return _THEME_QSS
+
+
+_load_theme_qss()
+
 PASS = 0
 WARN = 0
 FAIL = 0
@@ -59,25 +84,125 @@ def section(title):
 
 
 # ============================================================
-# 1. SYNTAX CHECK - All .py files must parse
+# SOURCE SCAN - Shared by the syntax and Unicode checks
 # ============================================================
-def check_syntax():
-    section("1. SYNTAX CHECK")
+_BAD_UNICODE_CHARS = {
+    '\u2713': 'checkmark', '\u2714': 'checkmark',
+    '\u2717': 'cross', '\u2718': 'cross', '\u274C': 'cross',
+    '\u26A1': 'lightning',
+}
+_BAD_UNICODE_RE = re.compile(
+    b'|'.join(re.escape(char.encode('utf-8')) for char in _BAD_UNICODE_CHARS)
+)
+
+_SCAN_RESULTS = None
+
+# Below this many files the process pool's startup costs more than it saves
+PARALLEL_MIN_FILES = 500
+
+
+def _pyc_is_current(fp, raw):
+    """Whether fp's cached .pyc was compiled from this exact source.
+
+    Checks the source mtime and size (or hash) recorded in the .pyc header,
+    like the import system does, so a source restored with an older mtime
+    than its cache is still re-checked.
+    """
+    try:
+        with open(importlib.util.cache_from_source(fp), 'rb') as f:
+            header = f.read(16)
+        st = os.stat(fp)
+    except OSError:
+        return False
+    if len(header) < 16 or header[:4] != importlib.util.MAGIC_NUMBER:
+        return False
+    flags = int.from_bytes(header[4:8], 'little')
+    if flags & 0x1:
+        # Hash-based .pyc (PEP 552)
+        return header[8:16] == importlib.util.source_hash(raw)
+    mtime = int.from_bytes(header[8:12], 'little')
+    size = int.from_bytes(header[12:16], 'little')
+    return mtime == (int(st.st_mtime) & 0xFFFFFFFF) and size == (st.st_size & 0xFFFFFFFF)
+
+
+def _scan_file(fp, check_syntax=True):
+    """Parse one file and find flagged Unicode in it (may run in a worker process).
+
+    With check_syntax=False only the Unicode byte scan runs (no compile,
+    no .pyc written). Returns (path, syntax_error_or_None, [flagged chars]).
+    """
+    with open(fp, 'rb') as f:
+        raw = f.read()
+    syntax_error = None
+    # A .pyc built from exactly this source means it already compiled cleanly
+    if check_syntax and not _pyc_is_current(fp, raw):
+        try:
+            # Also writes the .pyc, which warms the cache for the app start
+            py_compile.compile(fp, doraise=True)
+        except py_compile.PyCompileError as e:
+            syntax_error = str(e.exc_value)
+        except OSError:
+            # Read-only tree: the .pyc can't be written, just parse
+            try:
+                ast.parse(raw)
+            except SyntaxError as e:
+                syntax_error = str(e)
+    # One pass over the UTF-8 bytes; no decode needed to find the characters
+    found = set(_BAD_UNICODE_RE.findall(raw))
+    hits = [char for char in _BAD_UNICODE_CHARS if char.encode('utf-8') in found]
+    return fp, syntax_error, hits
+
+
+def _scan_sources():
+    """Walk the tree once and scan every .py file, across a process pool for large trees.
+
+    Results are cached so the syntax and Unicode checks share one pass.
+    """
+    global _SCAN_RESULTS
+    if _SCAN_RESULTS is not None:
+        return _SCAN_RESULTS
+
     py_files = []
     for root, dirs, files in os.walk(BASE_DIR):
         dirs[:] = [d for d in dirs if d not in ('__pycache__', '.git', 'assets', 'tools', 'recordings')]
         for fn in files:
-            if fn.endswith('.py') and fn != 'preflight.py':
+            if fn.endswith('.py'):
                 py_files.append(os.path.join(root, fn))
+    py_files.sort()
+    # preflight.py is only Unicode-checked; the syntax check skips itself
+    check_flags = [os.path.basename(fp) != 'preflight.py' for fp in py_files]
+
+    results = None
+    if len(py_files) >= PARALLEL_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+        try:
+            with ProcessPoolExecutor() as pool:
+                results = list(pool.map(_scan_file, py_files, check_flags, chunksize=16))
+        except (OSError, BrokenProcessPool):
+            # No multiprocessing support here (e.g. locked-down sandbox)
+            results = None
+    if results is None:
+        results = [_scan_file(fp, flag) for fp, flag in zip(py_files, check_flags)]
+
+    _SCAN_RESULTS = results
+    return results
+
 
-    for fp in sorted(py_files):
+# ============================================================
+# 1. SYNTAX CHECK - All .py files must parse
+# ============================================================
+def check_syntax():
+    section("1. SYNTAX CHECK")
+
+    for fp, syntax_error, _hits in _scan_sources():
+        if os.path.basename(fp) == 'preflight.py':
+            continue
         rel = os.path.relpath(fp, BASE_DIR)
-        try:
-            with open(fp, 'r', encoding='utf-8') as f:
-                ast.parse(f.read())
+        if syntax_error is None:
             log_pass(f"Syntax OK: {rel}")
-        except SyntaxError as e:
-            log_fail(f"Syntax ERROR: {rel}: {e}")
+        else:
+            log_fail(f"Syntax ERROR: {rel}: {syntax_error}")
 
 
 # ============================================================
@@ -131,6 +256,7 @@ def check_imports():
     # Utils modules
     utils_modules = [
         ("utils.spectrum_analyzer", "Spectrum analyzer"),
+        ("utils.fft_engine", "FFT engine"),
         ("utils.signal_detector", "Signal detector V1"),
         ("utils.signal_detector_v2", "Signal detector V2"),
         ("utils.signal_classifier", "Signal classifier"),
@@ -223,6 +349,9 @@ def check_dependencies():
         ("SoapySDR", "SoapySDR", "SDR hardware interface"),
         ("pyModeS", "pyModeS", "ADS-B message decoder"),
         ("bleak", "bleak", "BLE scanner"),
+        ("pyFFTW", "pyfftw", "FFTW-backed waterfall FFT"),
+        ("numba", "numba", "JIT-compiled FFT power kernels"),
+        ("CuPy", "cupy", "GPU waterfall FFT (CUDA)"),
     ]
 
     for name, import_name, desc in required:
@@ -357,6 +486,21 @@ def check_main_constructable():
 # ============================================================
 # 8. UI WIRING CHECK - Verify buttons, signals, and state logic
 # ============================================================
+def _signal_receivers(obj):
+    """Snapshot {signal_name: receiver_count} for the signals declared on obj's class."""
+    from PyQt5.QtCore import QMetaMethod
+
+    meta = obj.metaObject()
+    counts = {}
+    for i in range(meta.methodOffset(), meta.methodCount()):
+        method = meta.method(i)
+        if method.methodType() != QMetaMethod.Signal:
+            continue
+        name = bytes(method.name()).decode()
+        counts[name] = obj.receivers(getattr(obj, name))
+    return counts
+
+
 def check_ui_wiring():
     section("8. UI WIRING CHECK")
 
@@ -370,18 +514,15 @@ def check_ui_wiring():
             app = QApplication([])
             app.setApplicationName("RF Tactical Preflight")
 
-        # Load theme
-        from PyQt5.QtCore import QFile, QTextStream
-        qss_path = os.path.join(BASE_DIR, "config", "theme.qss")
-        qf = QFile(qss_path)
-        if qf.open(QFile.ReadOnly | QFile.Text):
-            app.setStyleSheet(QTextStream(qf).readAll())
-            qf.close()
+        # Load theme (cached; skip if already applied)
+        qss = _load_theme_qss()
+        if qss and app.styleSheet() != qss:
+            app.setStyleSheet(qss)
 
-        # Create the main window
+        # Create the main window. It is never shown: the checks below only
+        # need the widget tree, so skip the window manager round-trip.
         from main import KioskMainWindow
         window = KioskMainWindow()
-        window.show()
 
         # --- Check buttons exist ---
         expected_buttons = ["startButton", "stopButton", "markButton", "scanButton", "configButton"]
@@ -397,11 +538,12 @@ def check_ui_wiring():
             if name not in window.buttons:
                 continue
             btn = window.buttons[name]
-            if not btn.isVisible():
+            if not btn.isVisibleTo(window):
                 log_fail(f"Button {name} is NOT visible")
                 all_visible = False
-            if btn.size().width() < 10 or btn.size().height() < 10:
-                log_fail(f"Button {name} has zero/tiny size: {btn.size().width()}x{btn.size().height()}")
+            hint = btn.sizeHint()
+            if hint.width() < 10 or hint.height() < 10:
+                log_fail(f"Button {name} has zero/tiny size: {hint.width()}x{hint.height()}")
                 all_visible = False
         if all_visible:
             log_pass("All buttons visible with valid size")
@@ -443,54 +585,32 @@ def check_ui_wiring():
             log_warn(f"Initial tab is '{tab_name}', expected 'ADS-B'")
 
         # --- Check decoder start/stop updates button states ---
-        # Use QObject.receivers() which takes a SIGNAL signature, not pyqtBoundSignal
         if hasattr(window, '_adsb_manager') and window._adsb_manager is not None:
-            mgr = window._adsb_manager
-            # receivers() is a QObject method that takes a signal's C++ signature
-            try:
-                from PyQt5.QtCore import SIGNAL
-                started_receivers = mgr.receivers(SIGNAL("decoder_started(QString)"))
-                stopped_receivers = mgr.receivers(SIGNAL("decoder_stopped()"))
-                # decoder_started connects to: adsb_view.set_status + _update_button_states (lambda)
-                if started_receivers >= 2:
-                    log_pass(f"ADS-B decoder_started has {started_receivers} receivers (includes button update)")
-                elif started_receivers >= 1:
-                    log_warn(f"ADS-B decoder_started has only {started_receivers} receiver(s) -- button states may not update")
+            receivers = _signal_receivers(window._adsb_manager)
+            # decoder_started connects to: adsb_view.set_status + _update_button_states (lambda)
+            # decoder_stopped connects to: lambda set_status + _update_button_states
+            for sig_name in ("decoder_started", "decoder_stopped"):
+                count = receivers.get(sig_name)
+                if count is None:
+                    log_fail(f"ADS-B {sig_name} signal missing!")
+                elif count >= 2:
+                    log_pass(f"ADS-B {sig_name} has {count} receivers (includes button update)")
+                elif count >= 1:
+                    log_warn(f"ADS-B {sig_name} has only {count} receiver(s) -- button states may not update")
                 else:
-                    log_fail(f"ADS-B decoder_started has 0 receivers -- signal not connected!")
-                # decoder_stopped connects to: lambda set_status + _update_button_states
-                if stopped_receivers >= 2:
-                    log_pass(f"ADS-B decoder_stopped has {stopped_receivers} receivers (includes button update)")
-                elif stopped_receivers >= 1:
-                    log_warn(f"ADS-B decoder_stopped has only {stopped_receivers} receiver(s) -- button states may not update")
-                else:
-                    log_fail(f"ADS-B decoder_stopped has 0 receivers -- signal not connected!")
-            except Exception as e:
-                # Fallback: just check the manager has the signals defined
-                has_started = hasattr(mgr, 'decoder_started')
-                has_stopped = hasattr(mgr, 'decoder_stopped')
-                if has_started and has_stopped:
-                    log_pass("ADS-B decoder signals exist (receiver count unavailable)")
-                else:
-                    log_fail(f"ADS-B decoder missing signals: started={has_started} stopped={has_stopped}")
+                    log_fail(f"ADS-B {sig_name} has 0 receivers -- signal not connected!")
         else:
             log_warn("ADS-B manager not initialized")
 
         # --- Check SDR manager running_changed signal ---
         if hasattr(window, '_sdr_manager') and window._sdr_manager is not None:
-            mgr = window._sdr_manager
-            try:
-                from PyQt5.QtCore import SIGNAL
-                running_receivers = mgr.receivers(SIGNAL("running_changed(bool)"))
-                if running_receivers >= 1:
-                    log_pass(f"SDR running_changed has {running_receivers} receiver(s)")
-                else:
-                    log_fail("SDR running_changed has 0 receivers -- button states won't update on SDR start/stop!")
-            except Exception:
-                if hasattr(mgr, 'running_changed'):
-                    log_pass("SDR running_changed signal exists (receiver count unavailable)")
-                else:
-                    log_fail("SDR running_changed signal missing!")
+            running_receivers = _signal_receivers(window._sdr_manager).get("running_changed")
+            if running_receivers is None:
+                log_fail("SDR running_changed signal missing!")
+            elif running_receivers >= 1:
+                log_pass(f"SDR running_changed has {running_receivers} receiver(s)")
+            else:
+                log_fail("SDR running_changed has 0 receivers -- button states won't update on SDR start/stop!")
         else:
             log_warn("SDR manager not initialized")
 
@@ -537,28 +657,16 @@ def check_ui_wiring():
 def check_unicode():
     section("9. UNICODE CHECK")
 
-    bad_chars = {
-        '\u2713': 'checkmark', '\u2714': 'checkmark',
-        '\u2717': 'cross', '\u2718': 'cross', '\u274C': 'cross',
-        '\u26A1': 'lightning',
-    }
-
     issues = 0
-    checked = 0
-    for root, dirs, files in os.walk(BASE_DIR):
-        dirs[:] = [d for d in dirs if d not in ('__pycache__', '.git', 'assets', 'tools')]
-        for fn in files:
-            if not fn.endswith('.py'):
-                continue
-            fp = os.path.join(root, fn)
-            checked += 1
-            with open(fp, 'r', encoding='utf-8') as f:
-                content = f.read()
-            for char, name in bad_chars.items():
-                if char in content:
-                    rel = os.path.relpath(fp, BASE_DIR)
-                    log_warn(f"Unicode {name} (U+{ord(char):04X}) in {rel}")
-                    issues += 1
+    results = _scan_sources()
+    checked = len(results)
+    for fp, _syntax_error, hits in results:
+        if not hits:
+            continue
+        rel = os.path.relpath(fp, BASE_DIR)
+        for char in hits:
+            log_warn(f"Unicode {_BAD_UNICODE_CHARS[char]} (U+{ord(char):04X}) in {rel}")
+            issues += 1
 
     if issues == 0:
         log_pass(f"Unicode clean ({checked} files checked)")
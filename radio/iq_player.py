@@ -1,14 +1,36 @@
 """IQ playback for RF Tactical Monitor."""
 
-import time
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
+
+try:
+    import SoapySDR
+    from SoapySDR import SOAPY_SDR_TX, SOAPY_SDR_CF32, SOAPY_SDR_TIMEOUT
+    SDR_AVAILABLE = True
+except Exception:
+    SoapySDR = None
+    SOAPY_SDR_TX = None
+    SOAPY_SDR_CF32 = None
+    SOAPY_SDR_TIMEOUT = None
+    SDR_AVAILABLE = False
+
 from PyQt5.QtCore import QObject, pyqtSignal
 
 
 class IQPlayer(QObject):
-    """Plays back IQ recordings via HackRF TX."""
+    """Plays back IQ recordings via HackRF TX.
+
+    The HackRF is opened for each playback and released again before
+    playback_finished or playback_error is emitted, so other streams can
+    open it.
+    """
+
+    CHUNK_SIZE = 16384
+    WRITE_TIMEOUT_US = 100000
+    PROGRESS_EVERY_CHUNKS = 8
 
     playback_started = pyqtSignal()
     playback_progress = pyqtSignal(float)
@@ -42,17 +64,16 @@ class IQPlayer(QObject):
             if not iq_path.exists():
                 raise FileNotFoundError(f"IQ file not found: {iq_path}")
 
-            iq_data = np.fromfile(iq_path, dtype=np.complex64)
-            total_samples = len(iq_data)
+            # Memory-map instead of loading the whole capture; only the
+            # pages around the chunk being transmitted are resident.
+            mapping, iq_data = self._map_recording(iq_path)
+            total_samples = iq_data.shape[0]
 
             center_freq = metadata["center_freq_hz"]
             sample_rate = metadata["sample_rate_hz"]
             gain_vga = metadata["gain_vga"]
 
-            try:
-                import SoapySDR
-                from SoapySDR import SOAPY_SDR_TX, SOAPY_SDR_CF32
-            except ImportError:
+            if not SDR_AVAILABLE:
                 self.playback_error.emit("Playback unavailable - SoapySDR not installed")
                 self.playing = False
                 return
@@ -65,26 +86,71 @@ class IQPlayer(QObject):
             self.txStream = self.sdr.setupStream(SOAPY_SDR_TX, SOAPY_SDR_CF32)
             self.sdr.activateStream(self.txStream)
 
-            chunk_size = 16384
+            # Ping-pong between two chunk buffers: a single prefetch thread
+            # fills the next one from disk while writeStream drains the other.
+            buffers = [
+                np.empty(self.CHUNK_SIZE, dtype=np.complex64),
+                np.empty(self.CHUNK_SIZE, dtype=np.complex64),
+            ]
+            # One stable list per buffer, so full-chunk writes don't build a
+            # new list (and a new slice view) on every call.
+            buffer_lists = [[buffer] for buffer in buffers]
             samples_sent = 0
-
-            for i in range(0, total_samples, chunk_size):
-                if self.cancel_requested:
-                    break
-
-                chunk = iq_data[i : i + chunk_size]
-
-                sr = self.sdr.writeStream(self.txStream, [chunk], len(chunk))
-                if sr.ret < 0:
-                    raise RuntimeError(f"TX write error: {sr.ret}")
-
-                samples_sent += sr.ret
-                progress = samples_sent / total_samples if total_samples else 1.0
-                self.playback_progress.emit(progress)
-
-                time.sleep(0.001)
-
+            chunks_sent = 0
+
+            with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                pending = None
+                if total_samples:
+                    pending = prefetcher.submit(self._read_chunk, iq_data, 0, buffers[0])
+                active = 0
+                start = 0
+
+                while pending is not None:
+                    if self.cancel_requested:
+                        break
+
+                    count = pending.result()
+                    chunk = buffers[active][:count]
+                    start += count
+
+                    pending = None
+                    if start < total_samples:
+                        pending = prefetcher.submit(
+                            self._read_chunk, iq_data, start, buffers[active ^ 1]
+                        )
+
+                    # writeStream blocks until the HackRF has room, so it paces
+                    # the loop; a timeout just means "check cancel and retry".
+                    written = 0
+                    while written < count and not self.cancel_requested:
+                        if written == 0 and count == self.CHUNK_SIZE:
+                            buffs = buffer_lists[active]
+                        else:
+                            buffs = [chunk[written:]]
+                        sr = self.sdr.writeStream(
+                            self.txStream,
+                            buffs,
+                            count - written,
+                            timeoutUs=self.WRITE_TIMEOUT_US,
+                        )
+                        if sr.ret == SOAPY_SDR_TIMEOUT:
+                            continue
+                        if sr.ret < 0:
+                            raise RuntimeError(f"TX write error: {sr.ret}")
+                        written += sr.ret
+
+                    samples_sent += written
+                    chunks_sent += 1
+                    if pending is None or chunks_sent % self.PROGRESS_EVERY_CHUNKS == 0:
+                        self.playback_progress.emit(samples_sent / total_samples)
+
+                    active ^= 1
+
+            del iq_data
+            if mapping is not None:
+                mapping.close()
             self._cleanup_stream()
+            self._release_device()
             self.playing = False
 
             if self.cancel_requested:
@@ -93,9 +159,35 @@ class IQPlayer(QObject):
                 self.playback_finished.emit()
 
         except Exception as exc:
+            self._cleanup_stream()
+            self._release_device()
             self.playing = False
             self.playback_error.emit(str(exc))
-            self._cleanup_stream()
+
+    @staticmethod
+    def _map_recording(iq_path):
+        """Map a .iq file read-only as complex64; returns (mmap or None, array).
+
+        Trailing bytes of an interrupted recording that don't make up a
+        whole sample are ignored, as np.fromfile did.
+        """
+        count = iq_path.stat().st_size // np.dtype(np.complex64).itemsize
+        if count == 0:
+            return None, np.empty(0, dtype=np.complex64)
+        with open(iq_path, "rb") as file_handle:
+            mapping = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            try:
+                mapping.madvise(mmap.MADV_SEQUENTIAL)
+            except OSError:
+                pass
+        return mapping, np.frombuffer(mapping, dtype=np.complex64, count=count)
+
+    def _read_chunk(self, iq_data, start, buffer):
+        """Copy the next chunk of ``iq_data`` into ``buffer``; returns its length."""
+        count = min(self.CHUNK_SIZE, iq_data.shape[0] - start)
+        np.copyto(buffer[:count], iq_data[start : start + count])
+        return count
 
     def cancel_playback(self):
         """Cancel ongoing playback."""
@@ -109,4 +201,7 @@ class IQPlayer(QObject):
             except Exception:
                 pass
         self.txStream = None
-        self.sdr = None
\ No newline at end of file
+
+    def _release_device(self):
+        """Close the HackRF; dropping the last reference closes it."""
+        self.sdr = None
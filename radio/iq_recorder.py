@@ -5,41 +5,139 @@ Records IQ samples to disk with metadata and SHA-256 hashing.
 
 import hashlib
 import json
+import os
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 import numpy as np
 
 
+class _DirectIOWriter:
+    """Writes a capture with O_DIRECT so long recordings bypass the page cache.
+
+    Incoming bytes are staged in a page-aligned block and written out whole;
+    close() pads the final partial block and truncates the file back to the
+    real length. Linux only -- construction raises OSError if the filesystem
+    does not accept O_DIRECT writes.
+    """
+
+    ALIGNMENT = 4096
+    BLOCK_BYTES = 4 << 20
+
+    def __init__(self, path):
+        self._fd = os.open(
+            str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644
+        )
+        storage = np.zeros(self.BLOCK_BYTES + self.ALIGNMENT, dtype=np.uint8)
+        start = -storage.ctypes.data % self.ALIGNMENT
+        self._block = storage[start : start + self.BLOCK_BYTES]
+        self._fill = 0
+        self._size = 0
+
+        # Some filesystems (tmpfs, FUSE) accept the flag but reject the write
+        try:
+            os.write(self._fd, self._block[: self.ALIGNMENT])
+            os.ftruncate(self._fd, 0)
+            os.lseek(self._fd, 0, os.SEEK_SET)
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def write(self, data):
+        """Append a uint8 ndarray to the file."""
+        if self._fd < 0:
+            raise ValueError("I/O operation on closed file.")
+        total = len(data)
+        pos = 0
+        while pos < total:
+            take = min(self.BLOCK_BYTES - self._fill, total - pos)
+            self._block[self._fill : self._fill + take] = data[pos : pos + take]
+            self._fill += take
+            pos += take
+            if self._fill == self.BLOCK_BYTES:
+                self._write_block(self.BLOCK_BYTES)
+                self._fill = 0
+        self._size += total
+
+    def _write_block(self, nbytes):
+        view = memoryview(self._block[:nbytes])
+        written = 0
+        while written < nbytes:
+            written += os.write(self._fd, view[written:])
+
+    def close(self):
+        if self._fd < 0:
+            return
+        if self._fill:
+            padded = -(-self._fill // self.ALIGNMENT) * self.ALIGNMENT
+            self._block[self._fill : padded] = 0
+            self._write_block(padded)
+            self._fill = 0
+        os.ftruncate(self._fd, self._size)
+        fd, self._fd = self._fd, -1
+        # The number may be reused by the next open(); never write to it again
+        os.close(fd)
+
+
 class IQRecorder:
-    """Records IQ samples to disk with metadata."""
+    """Records IQ samples to disk with metadata.
+
+    Samples arrive on the SDR worker's detection thread while start, stop
+    and marks come from other threads; _lock serializes them so a write
+    never races the file being closed. get_recording_status() never takes
+    the lock (a write can block on disk): it reads a snapshot tuple that
+    is replaced whole after every change.
+
+    Args:
+        base_dir: Directory recordings are written to.
+        direct_io: Write through O_DIRECT where the platform and filesystem
+            support it, falling back to a buffered file otherwise.
+    """
 
-    def __init__(self, base_dir="recordings") -> None:
+    WRITE_BUFFER_BYTES = 1 << 20
+
+    def __init__(self, base_dir="recordings", direct_io=True) -> None:
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.direct_io = direct_io
 
         self.recording = False
         self.iq_file = None
         self.metadata = {}
         self.samples_written = 0
         self.start_time = None
+        self._start_monotonic_ns = None
         self.current_filename = None
+        self._hasher = None
+        self._lock = threading.Lock()
+        # (start monotonic ns, samples written, event count) while recording
+        self._status = None
+        # Bumped whenever recording starts or stops, so pollers can tell
+        # whether an idle status has changed since they last looked
+        self.state_version = 0
 
     def start_recording(self, center_freq, sample_rate, gain_lna, gain_vga):
         """Start recording IQ samples."""
+        with self._lock:
+            self._start_recording(center_freq, sample_rate, gain_lna, gain_vga)
+
+    def _start_recording(self, center_freq, sample_rate, gain_lna, gain_vga):
         if self.recording:
             raise RuntimeError("Already recording")
 
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        start_time = datetime.now(timezone.utc)
+        timestamp = start_time.strftime("%Y%m%d_%H%M%S")
         freq_mhz = center_freq / 1e6
         self.current_filename = f"iq_{timestamp}_{freq_mhz:.2f}MHz"
 
         iq_path = self.base_dir / f"{self.current_filename}.iq"
-        self.iq_file = open(iq_path, "wb")
+        self.iq_file = self._open_iq_file(iq_path)
 
         self.metadata = {
             "filename": self.current_filename,
-            "start_time": datetime.now(timezone.utc).isoformat(),
+            "start_time": start_time.isoformat(),
             "center_freq_hz": int(center_freq),
             "sample_rate_hz": int(sample_rate),
             "gain_lna": int(gain_lna),
@@ -54,38 +152,84 @@ class IQRecorder:
 
         self.recording = True
         self.samples_written = 0
-        self.start_time = datetime.now(timezone.utc)
+        self._hasher = hashlib.sha256()
+        self.start_time = start_time
+        self._start_monotonic_ns = time.monotonic_ns()
+        self._publish_status()
+        self.state_version += 1
+
+    def _publish_status(self):
+        # Called with _lock held; a single reference swap, so readers need no lock
+        if self.recording:
+            self._status = (
+                self._start_monotonic_ns,
+                self.samples_written,
+                len(self.metadata["signal_events"]),
+            )
+        else:
+            self._status = None
+
+    def _elapsed_seconds(self):
+        # Monotonic clock: no datetime allocation or tz work per status poll
+        return (time.monotonic_ns() - self._start_monotonic_ns) / 1e9
+
+    def _open_iq_file(self, iq_path):
+        if self.direct_io and hasattr(os, "O_DIRECT"):
+            try:
+                return _DirectIOWriter(iq_path)
+            except OSError:
+                pass
+        return open(iq_path, "wb", buffering=self.WRITE_BUFFER_BYTES)
 
     def write_samples(self, iq_samples):
         """Write IQ samples to file."""
+        with self._lock:
+            self._write_samples(iq_samples)
+
+    def _write_samples(self, iq_samples):
         if not self.recording or self.iq_file is None:
             return
 
-        self.iq_file.write(iq_samples.astype(np.complex64).tobytes())
+        # Producers already hand over complex64; only convert when they don't,
+        # and write straight from the array buffer without a bytes copy.
+        if iq_samples.dtype != np.complex64 or not iq_samples.flags.c_contiguous:
+            iq_samples = np.ascontiguousarray(iq_samples, dtype=np.complex64)
+        raw = iq_samples.view(np.uint8)
+        self.iq_file.write(raw)
+        self._hasher.update(raw)
         self.samples_written += len(iq_samples)
+        self._publish_status()
 
     def mark_signal_event(self, freq_hz, power_dbm, duration_sec):
         """Mark a detected signal during recording."""
-        if not self.recording or self.start_time is None:
-            return
+        with self._lock:
+            if not self.recording or self.start_time is None:
+                return
 
-        elapsed = (datetime.now(timezone.utc) - self.start_time).total_seconds()
+            elapsed = self._elapsed_seconds()
 
-        event = {
-            "timestamp_sec": round(elapsed, 3),
-            "frequency_hz": int(freq_hz),
-            "power_dbm": round(power_dbm, 1),
-            "duration_sec": round(duration_sec, 3),
-        }
+            event = {
+                "timestamp_sec": round(elapsed, 3),
+                "frequency_hz": int(freq_hz),
+                "power_dbm": round(power_dbm, 1),
+                "duration_sec": round(duration_sec, 3),
+            }
 
-        self.metadata["signal_events"].append(event)
+            self.metadata["signal_events"].append(event)
+            self._publish_status()
 
     def stop_recording(self):
         """Stop recording and save metadata."""
+        with self._lock:
+            return self._stop_recording()
+
+    def _stop_recording(self):
         if not self.recording:
             return None, None
 
         self.recording = False
+        self._publish_status()
+        self.state_version += 1
 
         if self.iq_file is not None:
             self.iq_file.close()
@@ -93,22 +237,14 @@ class IQRecorder:
 
         iq_path = self.base_dir / f"{self.current_filename}.iq"
 
-        sha256 = hashlib.sha256()
-        with open(iq_path, "rb") as file_handle:
-            while True:
-                chunk = file_handle.read(8192)
-                if not chunk:
-                    break
-                sha256.update(chunk)
-
         duration = 0.0
         if self.start_time is not None:
-            duration = (datetime.now(timezone.utc) - self.start_time).total_seconds()
+            duration = self._elapsed_seconds()
 
         self.metadata["duration_seconds"] = round(duration, 3)
         self.metadata["samples_written"] = self.samples_written
         self.metadata["file_size_bytes"] = iq_path.stat().st_size
-        self.metadata["sha256"] = sha256.hexdigest()
+        self.metadata["sha256"] = self._hasher.hexdigest()
 
         meta_path = self.base_dir / f"{self.current_filename}.json"
         with open(meta_path, "w", encoding="utf-8") as file_handle:
@@ -117,17 +253,19 @@ class IQRecorder:
         return str(iq_path), str(meta_path)
 
     def get_recording_status(self):
-        """Get current recording status."""
-        if not self.recording or self.start_time is None:
+        """Get current recording status (lock-free; safe from the FFT loop)."""
+        status = self._status
+        if status is None:
             return {"recording": False}
 
-        elapsed = (datetime.now(timezone.utc) - self.start_time).total_seconds()
-        file_size = self.samples_written * 8
+        start_ns, samples, events = status
+        elapsed = (time.monotonic_ns() - start_ns) / 1e9
+        file_size = samples * 8
 
         return {
             "recording": True,
             "duration_sec": round(elapsed, 1),
-            "samples": self.samples_written,
+            "samples": samples,
             "file_size_mb": round(file_size / 1024 / 1024, 2),
-            "events": len(self.metadata.get("signal_events", [])),
+            "events": events,
         }
\ No newline at end of file
@@ -6,6 +6,7 @@ start/stop/retune controls from the main GUI thread.
 
 import logging
 import os
+import time
 from pathlib import Path
 
 try:
@@ -19,7 +20,7 @@ try:
 except Exception:
     SoapySDR = None
     SDR_AVAILABLE = False
-from PyQt5.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+from PyQt5.QtCore import QObject, QRunnable, QThread, QThreadPool, Qt, pyqtSignal, pyqtSlot
 
 from radio.sdr_worker import SDRWorker
 from radio.iq_player import IQPlayer
@@ -97,6 +98,18 @@ if SDR_AVAILABLE:
     _verify_soapy_environment()
 
 
+class _ProbeTask(QRunnable):
+    """Runs one device probe on the global thread pool and reports back."""
+
+    def __init__(self, probe, finished):
+        super().__init__()
+        self._probe = probe
+        self._finished = finished
+
+    def run(self):
+        self._finished.emit(self._probe())
+
+
 class SDRManager(QObject):
     """Manages SDRWorker on a dedicated QThread.
 
@@ -105,7 +118,8 @@ class SDRManager(QObject):
     bridge data back to the main thread.
 
     Signals:
-        new_waterfall_row(object): Forwarded from SDRWorker -- float32 dB array.
+        new_waterfall_row(object): Forwarded from SDRWorker -- float32 dB array,
+            reused by the worker once the slot returns (copy to keep it).
         error_occurred(str): Forwarded from SDRWorker -- error messages.
         device_connected(str): Forwarded from SDRWorker -- connection info.
         device_disconnected(): Forwarded from SDRWorker -- device closed.
@@ -119,6 +133,8 @@ class SDRManager(QObject):
         gain_vga: VGA gain in dB.
         fft_size: Number of FFT bins.
         fft_avg_count: Number of FFTs to average per display row.
+        cpu_core: CPU core to pin the FFT loop to, or None (unpinned).
+        fft_window: FFT window function name (hanning, hamming, blackman, etc.).
         parent: Optional parent QObject.
     """
 
@@ -141,6 +157,10 @@ class SDRManager(QObject):
     playback_error = pyqtSignal(str)
     connection_changed = pyqtSignal(bool)
     running_changed = pyqtSignal(bool)
+    _probe_finished = pyqtSignal(bool)
+
+    # How long a probe result is trusted before enumerating USB again
+    PROBE_TTL_SEC = 2.0
 
     def __init__(
         self,
@@ -150,6 +170,8 @@ class SDRManager(QObject):
         gain_vga: int = 40,
         fft_size: int = 1024,
         fft_avg_count: int = 64,
+        cpu_core: int = None,
+        fft_window: str = "hanning",
         parent=None,
     ):
         super().__init__(parent)
@@ -160,20 +182,30 @@ class SDRManager(QObject):
         self._gain_vga = gain_vga
         self._fft_size = fft_size
         self._fft_avg_count = fft_avg_count
+        self._cpu_core = cpu_core
+        self._fft_window = fft_window
 
         self._thread = None
         self._worker = None
+        # Row buffers of the current worker; waterfall row signals index them.
+        # Rows tagged with another generation come from a previous worker.
+        self._row_ring = None
+        self._row_generation = None
         self._player = None
         self._player_thread = None
         self._is_connected = False
-        # Don't probe on init - just check if SoapySDR is available
-        # Actual device probe happens when START is pressed
+        self._probe_result = None
+        self._probe_time = 0.0
+        self._probe_pending = False
+        self._probe_finished.connect(self._on_probe_finished)
+        # Assume connected if SoapySDR is available until the owner runs
+        # probe_async(); constructing a manager never touches the hardware.
         self._set_connected(SDR_AVAILABLE)
 
     def _setup_worker(self):
         """Create the worker and thread, wire up signals."""
         if not self._is_connected:
-            self._set_connected(self._probe_device())
+            self._set_connected(self._probe_device_cached())
         self._thread = QThread()
         self._thread.setObjectName("SDRWorkerThread")
 
@@ -184,11 +216,17 @@ class SDRManager(QObject):
             gain_vga=self._gain_vga,
             fft_size=self._fft_size,
             fft_avg_count=self._fft_avg_count,
+            cpu_core=self._cpu_core,
+            fft_window=self._fft_window,
         )
 
         self._worker.moveToThread(self._thread)
+        self._row_ring = self._worker.row_ring
+        self._row_generation = self._worker.row_generation
 
-        self._worker.new_waterfall_row.connect(self.new_waterfall_row)
+        # Rows cross threads as ring indices (no copy, no object payload); the
+        # worker holds back new rows until credits come back in _on_waterfall_row.
+        self._worker.new_waterfall_row.connect(self._on_waterfall_row, Qt.QueuedConnection)
         self._worker.spectrum_stats_updated.connect(self.spectrum_stats_updated)
         self._worker.signal_event_detected.connect(self.signal_event_detected)
         self._worker.signal_event_closed.connect(self.signal_event_closed)
@@ -198,12 +236,27 @@ class SDRManager(QObject):
         self._worker.overflow_count_updated.connect(self.overflow_count_updated)
         self._worker.connection_status.connect(self.connection_status)
         self._worker.recording_status.connect(self.recording_status)
-        self._worker.signal_detected.connect(self.signal_detected)
+        self._worker.signal_detected.connect(self._on_signals_detected)
         self._worker.connection_status.connect(self._on_connection_status)
 
         self._thread.started.connect(self._worker.start_capture)
         self._thread.finished.connect(self._on_thread_finished)
 
+    def _on_waterfall_row(self, generation, index):
+        """Forward a waterfall row and return its credit to the worker."""
+        if generation != self._row_generation:
+            # Queued before a restart: its ring and credit belong to the old worker
+            return
+        self.new_waterfall_row.emit(self._row_ring[index])
+        # Only after receivers are done with it; the worker reuses the buffer
+        if self._worker is not None:
+            self._worker.row_consumed()
+
+    def _on_signals_detected(self, events):
+        """Fan a block's batch of detections out as individual events."""
+        for event in events:
+            self.signal_detected.emit(event)
+
     def _on_device_disconnected(self):
         """Handle worker signaling device closed -- stop the thread."""
         # Don't set connected=False here - device is still available
@@ -322,6 +375,17 @@ class SDRManager(QObject):
         if self._worker is not None:
             self._worker.set_gains(gain_lna, gain_vga)
 
+    def set_fft_window(self, window_name: str):
+        """Change the waterfall FFT window live.
+
+        Args:
+            window_name: Window function name (hanning, hamming, blackman, etc.).
+        """
+        self._fft_window = window_name
+
+        if self._worker is not None:
+            self._worker.set_fft_window(window_name)
+
     def start_recording(self):
         """Start IQ recording on the worker thread."""
         if self._worker is not None:
@@ -410,6 +474,47 @@ class SDRManager(QObject):
             self._set_connected(False)
         # Don't change connection state on normal DISCONNECTED - device is still available
 
+    def probe_async(self):
+        """Probe for the HackRF on the global thread pool.
+
+        The result lands in the probe cache and updates the connection
+        state (unless a capture is running, which reports its own state).
+        """
+        if not SDR_AVAILABLE or self._probe_pending:
+            return
+        self._probe_pending = True
+        QThreadPool.globalInstance().start(_ProbeTask(self._probe_device, self._probe_finished))
+
+    def _on_probe_finished(self, found: bool):
+        self._probe_pending = False
+        self._store_probe(found)
+        if not self.is_running:
+            self._set_connected(found)
+
+    def _store_probe(self, found: bool):
+        self._probe_result = found
+        self._probe_time = time.monotonic()
+
+    def _probe_device_cached(self) -> bool:
+        """Probe result from the last PROBE_TTL_SEC, or a fresh probe.
+
+        While a probe_async() task is still enumerating, its result is not
+        waited for and no second enumeration starts: the last known state
+        is returned instead.
+        """
+        if self._probe_pending:
+            if self._probe_result is not None:
+                return self._probe_result
+            return self._is_connected
+        if (
+            self._probe_result is not None
+            and time.monotonic() - self._probe_time < self.PROBE_TTL_SEC
+        ):
+            return self._probe_result
+        found = self._probe_device()
+        self._store_probe(found)
+        return found
+
     def _probe_device(self) -> bool:
         """Probe for available SDR devices with detailed logging."""
         if not SDR_AVAILABLE:
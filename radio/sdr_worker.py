@@ -4,6 +4,12 @@ Connects to HackRF via SoapySDR, reads IQ samples, computes FFT,
 and emits waterfall rows via Qt signals.
 """
 
+import ctypes
+import itertools
+import logging
+import os
+import queue
+import threading
 import time
 import numpy as np
 
@@ -19,23 +25,30 @@ except Exception:
     SOAPY_SDR_OVERFLOW = None
     SDR_AVAILABLE = False
 
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QMutex, QMutexLocker
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from radio.iq_recorder import IQRecorder
 from utils.signal_detector import SignalDetector
 from utils.signal_detector_v2 import SignalDetectorV2
-from utils.spectrum_analyzer import SpectrumAnalyzer
+from utils.spectrum_analyzer import SpectrumAnalyzer, get_window
+from utils.fft_engine import FFTEngine, empty_aligned, power_to_db
 from utils.tx_signal_generator import TxSignalGenerator, TxSignalParams, TxMode
 from utils.flow_tracer import get_flow_tracer
 
 from utils.logger import setup_logger
 
+# Distinct per worker, so rows still queued from a previous worker can be told apart
+_ROW_GENERATIONS = itertools.count(1)
+
 
 class SDRWorker(QObject):
     """Worker that reads IQ from HackRF and emits FFT magnitude rows.
 
     Signals:
-        new_waterfall_row(np.ndarray): Emitted with float32 dB magnitude array.
+        new_waterfall_row(int, int): Emitted with this worker's
+            row_generation and the row_ring index of a new float32 dB
+            magnitude row. The buffer is reused once the receiver calls
+            row_consumed(); copy what you keep.
         error_occurred(str): Emitted when an error occurs (e.g., device not found).
         device_connected(str): Emitted with device info string on successful connect.
         device_disconnected(): Emitted when device is closed.
@@ -47,9 +60,46 @@ class SDRWorker(QObject):
         gain_vga: VGA gain (0-62 dB in 2 dB steps).
         fft_size: Number of FFT bins.
         fft_avg_count: Number of FFTs to average per output row.
+        cpu_core: Pin the FFT loop thread (only; the reader and detection
+            threads are left to the OS) to this CPU core, or None to let the
+            OS schedule it.
+        fft_window: FFT window function name (hanning, hamming, blackman, etc.).
     """
 
-    new_waterfall_row = pyqtSignal(object)
+    # Samples requested per readStream call. Reading well past one FFT block
+    # amortizes the per-call overhead; FFT blocks are sliced out locally.
+    READ_BLOCK_SAMPLES = 16384
+    # Extra USB transfers queued in the HackRF driver (SoapyHackRF default: 15)
+    RX_STREAM_ARGS = {"buffers": "32"}
+    # Read blocks queued between the readStream thread and the FFT loop, so
+    # a slow row doesn't stall the USB side.
+    RX_QUEUE_BLOCKS = 16
+    # Read blocks the FFT loop is done with go to a detection thread (signal
+    # detectors + recorder) before returning to the pool. Past this backlog
+    # the detectors skip blocks to catch up; recording never does.
+    DETECT_BACKLOG_BLOCKS = RX_QUEUE_BLOCKS // 2
+
+    # TX writes go out in chunks this size
+    TX_CHUNK_SAMPLES = 16384
+    # Minimum spacing of overflow count and TX progress emits; both can
+    # change far faster than anyone can read them
+    STATUS_EMIT_INTERVAL_SEC = 0.1
+
+    # Batched FFT + power sum on a CUDA GPU via CuPy when one is present.
+    # Below GPU_MIN_FFT_SIZE bins the per-row upload and launch overhead
+    # outweighs the transform, so smaller FFTs stay on the CPU.
+    GPU_FFT = True
+    GPU_MIN_FFT_SIZE = 2048
+
+    # Waterfall rows emitted but not yet picked up by the GUI thread. Past
+    # this, new rows are dropped instead of piling up in the event queue.
+    MAX_ROWS_IN_FLIGHT = 4
+    # Emitted rows come from this many reused buffers. A row stays valid until
+    # the receiver's slot returns; the ring must outlast the in-flight rows
+    # plus the one being computed.
+    ROW_RING_SIZE = 2 * MAX_ROWS_IN_FLIGHT
+
+    new_waterfall_row = pyqtSignal(int, int)
     spectrum_stats_updated = pyqtSignal(object)   # SpectrumStats from analyzer
     signal_event_detected = pyqtSignal(object)    # SignalEvent from V2 detector
     signal_event_closed = pyqtSignal(object)      # Closed SignalEvent with features
@@ -59,7 +109,8 @@ class SDRWorker(QObject):
     connection_status = pyqtSignal(str, float)
     recording_status = pyqtSignal(object)
     overflow_count_updated = pyqtSignal(int)
-    signal_detected = pyqtSignal(dict)
+    # One list of event dicts per block, so a burst crosses threads once
+    signal_detected = pyqtSignal(list)
     tx_progress = pyqtSignal(float)  # 0.0 to 1.0
     tx_complete = pyqtSignal()
     tx_error = pyqtSignal(str)
@@ -72,6 +123,8 @@ class SDRWorker(QObject):
         gain_vga: int = 40,
         fft_size: int = 1024,
         fft_avg_count: int = 64,
+        cpu_core: int = None,
+        fft_window: str = "hanning",
         parent=None,
     ):
         super().__init__(parent)
@@ -82,18 +135,68 @@ class SDRWorker(QObject):
         self._gain_vga = gain_vga
         self._fft_size = fft_size
         self._fft_avg_count = fft_avg_count
+        self._cpu_core = cpu_core
 
-        self._running = False
-        self._mutex = QMutex()
+        # Set while the capture loop should keep going. The loop polls it once
+        # per row; Event.is_set() is a plain flag read, no lock pair.
+        self._running = threading.Event()
         self._sdr = None
         self._stream = None
 
-        self._window = np.hanning(self._fft_size).astype(np.float32)
-        self._iq_buffer = np.zeros(self._fft_size, dtype=np.complex64)
-        self._power_accum = np.zeros(self._fft_size, dtype=np.float64)
+        # For even N, FFT(x * (-1)^n) is already the fftshift-ed spectrum, so
+        # the sign flip is folded into the window (see _load_window).
+        self._shift_in_window = self._fft_size % 2 == 0
+        # Window repeated per I/Q lane: windowing then runs as one float32
+        # multiply over the interleaved real view, with no complex upcast.
+        # Kept SIMD-aligned like the FFT input it is multiplied into.
+        self._window_iq = self._load_window(fft_window)
+        # One batched plan transforms all fft_avg_count blocks of a row at once
+        self._fft = FFTEngine(
+            self._fft_size,
+            batch=self._fft_avg_count,
+            use_gpu=self.GPU_FFT and self._fft_size >= self.GPU_MIN_FFT_SIZE,
+        )
+        # A reader thread fills read blocks from a fixed pool and queues them;
+        # the capture loop takes one block (_rx_buffer) at a time and
+        # _iq_buffer is a view of the FFT-sized slice being processed. Used
+        # blocks pass through the detection thread and back to the pool.
+        # Pool entries are the one-element buffer lists readStream takes.
+        # Beyond the RX_QUEUE_BLOCKS that can sit queued, one block is held
+        # by the capture loop and one by the detection thread.
+        blocks_per_read = max(1, -(-self.READ_BLOCK_SAMPLES // self._fft_size))
+        self._read_block = blocks_per_read * self._fft_size
+        self._rx_pool = [
+            [np.zeros(self._read_block, dtype=np.complex64)]
+            for _ in range(self.RX_QUEUE_BLOCKS + 2)
+        ]
+        self._rx_free = queue.SimpleQueue()
+        self._rx_filled = queue.SimpleQueue()
+        self._rx_thread = None
+        self._detect_queue = queue.SimpleQueue()
+        self._detect_thread = None
+        self._detect_blocks_skipped = 0
+        # Bumped on retune; blocks tagged with an older value are dropped
+        self._rx_generation = 0
+        self._rx_current = None
+        self._rx_current_generation = 0
+        self._rx_buffer = self._rx_pool[0][0]
+        self._rx_pos = self._read_block
+        self._iq_buffer = self._rx_buffer[: self._fft_size]
+        # float32 is ample for summing fft_avg_count positive powers and
+        # halves accumulator traffic against the float32 emitted row
+        self._power_accum = np.zeros(self._fft_size, dtype=np.float32)
+        self._power_scratch = np.empty(self._fft.input.shape, dtype=np.float32)
+        self._row_ring = [
+            np.empty(self._fft_size, dtype=np.float32) for _ in range(self.ROW_RING_SIZE)
+        ]
+        self._row_ring_idx = 0
         self._overflow_count = 0
+        self._row_credits = threading.BoundedSemaphore(self.MAX_ROWS_IN_FLIGHT)
+        self._row_generation = next(_ROW_GENERATIONS)
         self._recorder = IQRecorder()
         self._last_record_status = 0.0
+        self._last_db_log = 0.0
+        self._last_record_version = -1
         self._signal_detector = SignalDetector(
             sample_rate=self._sample_rate,
             threshold_db=10,  # 10 dB above noise floor (lowered from 15 for better sensitivity)
@@ -102,6 +205,9 @@ class SDRWorker(QObject):
         )
         self._samples_processed = 0
         self._last_detector_log = 0.0
+        # Per-block flow tracing builds and writes several log records per
+        # FFT block (thousands a second), so it only runs at DEBUG level.
+        self._trace_blocks = False
         self._logger = setup_logger(__name__)
         self._tx_stream = None
         self._tx_active = False
@@ -120,7 +226,7 @@ class SDRWorker(QObject):
         self._spectrum_analyzer = SpectrumAnalyzer(
             fft_size=self._fft_size,
             sample_rate=self._sample_rate,
-            window="hanning",
+            window=fft_window,
             history_size=50,
         )
 
@@ -169,7 +275,9 @@ class SDRWorker(QObject):
             self._sdr.setGain(SOAPY_SDR_RX, 0, "VGA", self._gain_vga)
             self._sdr.setAntenna(SOAPY_SDR_RX, 0, "TX/RX")
 
-            self._stream = self._sdr.setupStream(SOAPY_SDR_RX, SOAPY_SDR_CF32, [0])
+            self._stream = self._sdr.setupStream(
+                SOAPY_SDR_RX, SOAPY_SDR_CF32, [0], self.RX_STREAM_ARGS
+            )
             if self._stream is None:
                 raise RuntimeError("Failed to setup RX stream")
 
@@ -221,192 +329,358 @@ class SDRWorker(QObject):
         self.device_disconnected.emit()
         self.connection_status.emit("DISCONNECTED", 0.0)
 
-    def _read_iq_block(self) -> bool:
-        """Read one FFT-sized block of IQ samples into the buffer.
+    def _pin_current_thread(self):
+        """Pin the calling thread to _cpu_core, keeping FFT plans cache-hot."""
+        if self._cpu_core is None:
+            return
+        try:
+            if hasattr(os, "sched_setaffinity"):
+                # pid 0 is the calling thread on Linux
+                os.sched_setaffinity(0, {self._cpu_core})
+            elif os.name == "nt":
+                kernel32 = ctypes.windll.kernel32
+                kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(), 1 << self._cpu_core)
+            else:
+                return
+            self._logger.info("FFT loop pinned to CPU %d", self._cpu_core)
+        except (OSError, ValueError, AttributeError) as exc:
+            self._logger.warning("Could not pin FFT loop to CPU %s: %s", self._cpu_core, exc)
+
+    def _start_reader(self):
+        """Reset the read-block queues and start the readStream thread."""
+        self._rx_free = queue.SimpleQueue()
+        self._rx_filled = queue.SimpleQueue()
+        for buffs in self._rx_pool:
+            self._rx_free.put(buffs)
+        self._rx_current = None
+        self._rx_pos = self._read_block
+        self._rx_thread = threading.Thread(
+            target=self._reader_loop, name="SDRWorker-rx", daemon=True
+        )
+        self._rx_thread.start()
+
+    def _stop_reader(self):
+        """Wait for the readStream thread; _running must already be clear."""
+        if self._rx_thread is not None:
+            self._rx_thread.join()
+            self._rx_thread = None
+
+    def _start_detector(self):
+        """Start the thread that runs detectors and the recorder off the FFT loop."""
+        self._detect_queue = queue.SimpleQueue()
+        self._detect_blocks_skipped = 0
+        self._detect_thread = threading.Thread(
+            target=self._detect_loop, name="SDRWorker-detect", daemon=True
+        )
+        self._detect_thread.start()
+
+    def _stop_detector(self):
+        """Let the detection thread drain its queue (so recordings are complete) and exit."""
+        if self._detect_thread is not None:
+            self._detect_queue.put(None)
+            self._detect_thread.join()
+            self._detect_thread = None
+            if self._detect_blocks_skipped:
+                self._logger.warning(
+                    "Signal detection skipped %d read blocks to keep up; "
+                    "signals in them may have been missed",
+                    self._detect_blocks_skipped,
+                )
+
+    def _detect_loop(self):
+        """Record and run signal detection on each read block, then free it."""
+        fft_size = self._fft_size
+        while True:
+            item = self._detect_queue.get()
+            if item is None:
+                return
+            buffs, count = item
+            block = buffs[0]
+            try:
+                if self._recorder.recording:
+                    self._recorder.write_samples(block[:count])
+                if self._detect_queue.qsize() > self.DETECT_BACKLOG_BLOCKS:
+                    self._detect_blocks_skipped += 1
+                    self._samples_processed += count
+                    if self._detect_blocks_skipped == 1:
+                        get_flow_tracer().warning(
+                            "ISM", "Detection falling behind; skipping blocks (signals may be missed)"
+                        )
+                else:
+                    for start in range(0, count, fft_size):
+                        self._detect_block(block[start : start + fft_size])
+            except Exception as exc:
+                get_flow_tracer().fail("ISM", f"Detection thread error: {exc}")
+                self._logger.exception("Detection thread error")
+            finally:
+                self._rx_free.put(buffs)
+
+    def _finish_rx_block(self):
+        """Pass the current read block on to the detection thread."""
+        if self._rx_current is not None:
+            self._detect_queue.put((self._rx_current, min(self._rx_pos, self._read_block)))
+            self._rx_current = None
+
+    def _reader_loop(self):
+        """Keep readStream busy, independent of how long each FFT row takes."""
+        flow = get_flow_tracer()
+        running = self._running.is_set
+        while running():
+            try:
+                buffs = self._rx_free.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            generation = self._rx_generation
+            if self._trace_blocks:
+                flow.step("ISM", f"Reading {self._read_block} IQ samples from HackRF")
+            if not self._fill_rx_block(buffs, flow):
+                # Wake the capture loop so it sees the failure (or the stop)
+                self._rx_filled.put((None, generation))
+                return
+            self._rx_filled.put((buffs, generation))
+
+    def _fill_rx_block(self, buffs, flow) -> bool:
+        """Fill one pool block from the RX stream.
 
         Returns:
-            True if a full block was read, False on error.
+            True once the block is full, False on a stream error or stop.
         """
-        flow = get_flow_tracer()
-        flow.enter("ISM", "_read_iq_block", fft_size=self._fft_size)
-        
-        try:
-            samples_needed = self._fft_size
-            offset = 0
-            
-            flow.step("ISM", f"Reading {samples_needed} IQ samples from HackRF")
-
-            while offset < samples_needed:
-                remaining = samples_needed - offset
-                sr = self._sdr.readStream(
-                    self._stream,
-                    [self._iq_buffer[offset:]],
-                    remaining,
-                    timeoutUs=500000,
-                )
-                ret_code = sr.ret
-
-                if ret_code < 0:
-                    if ret_code == SOAPY_SDR_OVERFLOW:
-                        self._overflow_count += 1
-                        self.overflow_count_updated.emit(self._overflow_count)
-                        flow.warning("ISM", f"Buffer overflow (count: {self._overflow_count})")
-                        continue
-                    error_msg = SoapySDR.errToStr(ret_code)
-                    flow.fail("ISM", f"readStream error: {error_msg}")
-                    self._logger.error("readStream error: %s", error_msg)
-                    self.error_occurred.emit(f"readStream error: {error_msg}")
-                    flow.exit("ISM", "_read_iq_block", "FAILED")
+        block = buffs[0]
+        samples_needed = self._read_block
+        offset = 0
+        read_stream = self._sdr.readStream
+        stream = self._stream
+        running = self._running.is_set
+
+        while offset < samples_needed:
+            remaining = samples_needed - offset
+            # Only a short read needs a fresh view past the filled part
+            read_buffs = buffs if offset == 0 else [block[offset:]]
+            sr = read_stream(stream, read_buffs, remaining, timeoutUs=500000)
+            ret_code = sr.ret
+
+            if ret_code < 0:
+                if ret_code == SOAPY_SDR_OVERFLOW:
+                    # Reported once per row by the capture loop
+                    self._overflow_count += 1
+                    flow.warning("ISM", f"Buffer overflow (count: {self._overflow_count})")
+                    continue
+                error_msg = SoapySDR.errToStr(ret_code)
+                flow.fail("ISM", f"readStream error: {error_msg}")
+                self._logger.error("readStream error: %s", error_msg)
+                self.error_occurred.emit(f"readStream error: {error_msg}")
+                return False
+
+            if ret_code == 0:
+                if not running():
                     return False
+                continue
 
-                if ret_code == 0:
-                    continue
+            offset += ret_code
 
-                offset += ret_code
-            
-            flow.success("ISM", f"Read {offset} samples successfully")
+        return True
 
-            # Always process samples for signal detection
-            flow.step("ISM", "Calling SignalDetector.process_samples()")
-            valid_samples = self._iq_buffer[:offset].copy()
-            
+    def _next_rx_block(self) -> bool:
+        """Hand the current read block back and take the next queued one.
+
+        Returns:
+            True with the block in _rx_buffer, False on reader failure or stop.
+        """
+        self._finish_rx_block()
+
+        running = self._running.is_set
+        while True:
             try:
-                detected = self._signal_detector.process_samples(valid_samples)
+                buffs, generation = self._rx_filled.get(timeout=0.5)
+            except queue.Empty:
+                if not running():
+                    return False
+                continue
+            if buffs is None:
+                return False
+            if generation != self._rx_generation:
+                # Read before the last retune
+                self._rx_free.put(buffs)
+                continue
+            self._rx_current = buffs
+            self._rx_current_generation = generation
+            self._rx_buffer = buffs[0]
+            return True
+
+    def _read_iq_block(self) -> bool:
+        """Point _iq_buffer at the next FFT-sized block of IQ samples.
+
+        Returns:
+            True if a block is ready, False on reader failure or stop.
+        """
+        if (
+            self._rx_current is None
+            or self._rx_pos >= self._read_block
+            or self._rx_current_generation != self._rx_generation
+        ):
+            if not self._next_rx_block():
+                return False
+            self._rx_pos = 0
+
+        self._iq_buffer = self._rx_buffer[self._rx_pos : self._rx_pos + self._fft_size]
+        self._rx_pos += self._fft_size
+        return True
+
+    def _detect_block(self, samples):
+        """Run both signal detectors over one FFT-sized block (detection thread)."""
+        flow = get_flow_tracer()
+        trace = self._trace_blocks
+        if trace:
+            flow.enter("ISM", "_detect_block", fft_size=len(samples))
+            flow.step("ISM", "Calling SignalDetector.process_samples()")
+
+        # Views into the read block are fine: detectors keep no references
+        valid_samples = samples
+        
+        try:
+            detected = self._signal_detector.process_samples(valid_samples)
+            if trace:
                 flow.success("ISM", f"Signal detection complete (found {len(detected)} signals)")
-            except Exception as e:
-                flow.fail("ISM", f"Signal detection failed: {e}")
-                detected = []
-            
-            # Log noise floor every 5 seconds for debugging (time-based)
-            now = time.time()
-            if now - self._last_detector_log >= 5.0:
-                self._last_detector_log = now
-                flow.data("ISM", "noise_floor", f"{self._signal_detector.noise_floor_db:.1f} dBm")
-                flow.data("ISM", "threshold", f"+{self._signal_detector.threshold_db:.1f} dB")
-                flow.data("ISM", "absolute_threshold", f"{self._signal_detector.noise_floor_db + self._signal_detector.threshold_db:.1f} dBm")
-                self._logger.info(" Signal Detector: noise_floor=%.1f dBm, threshold=+%.1f dB, absolute_threshold=%.1f dBm",
-                                self._signal_detector.noise_floor_db,
-                                self._signal_detector.threshold_db,
-                                self._signal_detector.noise_floor_db + self._signal_detector.threshold_db)
-            
-            if detected:
-                for sig in detected:
-                    timestamp = self._samples_processed / self._sample_rate
-                    freq_hz = self._center_freq + sig["center_freq_offset_hz"]
-                    
-                    flow.success("ISM", f"Signal found: {freq_hz/1e6:.3f} MHz @ {sig['peak_power_dbm']:.1f} dBm")
-                    
-                    # Log signal detection
-                    self._logger.info(" SIGNAL DETECTED: %.3f MHz @ %.1f dBm (duration: %.3fs)",
-                                    freq_hz / 1e6, sig["peak_power_dbm"], sig["duration_sec"])
-                    
-                    # Emit signal detection event
-                    self.signal_detected.emit(
-                        {
-                            "timestamp": timestamp,
-                            "frequency": freq_hz,
-                            "center_freq_hz": freq_hz,
-                            "power": sig["peak_power_dbm"],
-                            "peak_power_dbm": sig["peak_power_dbm"],
-                            "duration": sig["duration_sec"],
-                            "duration_sec": sig["duration_sec"],
-                            "bandwidth_hz": sig.get("bandwidth_hz", 50000),
-                        }
-                    )
-                    
-                    # If recording, also mark in recording file
-                    if self._recorder.recording:
-                        self._recorder.mark_signal_event(
-                            freq_hz=freq_hz,
-                            power_dbm=sig["peak_power_dbm"],
-                            duration_sec=sig["duration_sec"],
-                        )
-            
-            # ── V2 Signal Detection Pipeline (RFwatch-inspired) ──
-            try:
-                v2_result = self._detector_v2.process_chunk(valid_samples)
+        except Exception as e:
+            flow.fail("ISM", f"Signal detection failed: {e}")
+            detected = []
+        
+        # Log noise floor every 5 seconds for debugging (time-based)
+        now = time.time()
+        if now - self._last_detector_log >= 5.0:
+            self._last_detector_log = now
+            flow.data("ISM", "noise_floor", f"{self._signal_detector.noise_floor_db:.1f} dBm")
+            flow.data("ISM", "threshold", f"+{self._signal_detector.threshold_db:.1f} dB")
+            flow.data("ISM", "absolute_threshold", f"{self._signal_detector.noise_floor_db + self._signal_detector.threshold_db:.1f} dBm")
+            self._logger.info(" Signal Detector: noise_floor=%.1f dBm, threshold=+%.1f dB, absolute_threshold=%.1f dBm",
+                            self._signal_detector.noise_floor_db,
+                            self._signal_detector.threshold_db,
+                            self._signal_detector.noise_floor_db + self._signal_detector.threshold_db)
+        
+        if detected:
+            # Every signal from this block shares the block's start time
+            timestamp = self._samples_processed / self._sample_rate
+            events = []
+            for sig in detected:
+                freq_hz = self._center_freq + sig["center_freq_offset_hz"]
                 
-                # Emit active events
-                for evt in v2_result.get("active_events", []):
-                    self.signal_event_detected.emit(evt)
+                flow.success("ISM", f"Signal found: {freq_hz/1e6:.3f} MHz @ {sig['peak_power_dbm']:.1f} dBm")
                 
-                # Emit closed events (with extracted features)
-                for evt in v2_result.get("closed_events", []):
-                    self.signal_event_closed.emit(evt)
-                    self._logger.info(
-                        " Signal event closed: %s | center=%.3f MHz | dur=%.3fs | hits=%d",
-                        evt.id,
-                        evt.last_center / 1e6 if evt.last_center else 0,
-                        evt.duration_sec,
-                        evt.hit_count,
+                # Log signal detection
+                self._logger.info(" SIGNAL DETECTED: %.3f MHz @ %.1f dBm (duration: %.3fs)",
+                                freq_hz / 1e6, sig["peak_power_dbm"], sig["duration_sec"])
+                
+                events.append(
+                    {
+                        "timestamp": timestamp,
+                        "frequency": freq_hz,
+                        "center_freq_hz": freq_hz,
+                        "power": sig["peak_power_dbm"],
+                        "peak_power_dbm": sig["peak_power_dbm"],
+                        "duration": sig["duration_sec"],
+                        "duration_sec": sig["duration_sec"],
+                        "bandwidth_hz": sig.get("bandwidth_hz", 50000),
+                    }
+                )
+                
+                # If recording, also mark in recording file
+                if self._recorder.recording:
+                    self._recorder.mark_signal_event(
+                        freq_hz=freq_hz,
+                        power_dbm=sig["peak_power_dbm"],
+                        duration_sec=sig["duration_sec"],
                     )
-            except Exception as e:
-                flow.warning("ISM", f"V2 detector error: {e}")
 
-            # If recording, write samples to file
-            if self._recorder.recording:
-                self._recorder.write_samples(valid_samples)
-
-            self._samples_processed += offset
+            self.signal_detected.emit(events)
+        
+        # ── V2 Signal Detection Pipeline (RFwatch-inspired) ──
+        try:
+            v2_result = self._detector_v2.process_chunk(valid_samples)
             
-            flow.exit("ISM", "_read_iq_block", "SUCCESS")
-            return True
+            # Emit active events
+            for evt in v2_result.get("active_events", []):
+                self.signal_event_detected.emit(evt)
             
+            # Emit closed events (with extracted features)
+            for evt in v2_result.get("closed_events", []):
+                self.signal_event_closed.emit(evt)
+                self._logger.info(
+                    " Signal event closed: %s | center=%.3f MHz | dur=%.3fs | hits=%d",
+                    evt.id,
+                    evt.last_center / 1e6 if evt.last_center else 0,
+                    evt.duration_sec,
+                    evt.hit_count,
+                )
         except Exception as e:
-            flow.fail("ISM", f"Unexpected error: {e}")
-            flow.exit("ISM", "_read_iq_block", "FAILED")
-            return False
+            flow.warning("ISM", f"V2 detector error: {e}")
+
+        self._samples_processed += len(samples)
+
+        if trace:
+            flow.exit("ISM", "_detect_block", "SUCCESS")
+
+    def _accumulate_fft_power(self):
+        """FFT the row's windowed blocks in one batch and sum their power.
 
-    def _compute_fft_db(self) -> np.ndarray:
-        """Apply window, compute FFT, return power in linear scale."""
-        windowed = self._iq_buffer * self._window
-        spectrum = np.fft.fftshift(np.fft.fft(windowed))
-        # Normalize by FFT size to get proper power scaling
-        power = (np.abs(spectrum) ** 2) / (self._fft_size ** 2)
-        return power
+        The accumulator holds raw |X|^2; normalization by the FFT size and
+        the averaging count is applied once per row in start_capture.
+        """
+        self._fft.accumulate_power(self._power_accum, self._power_scratch)
 
     @pyqtSlot()
     def start_capture(self):
         """Begin the IQ capture and FFT processing loop."""
-        with QMutexLocker(self._mutex):
-            if self._running:
-                return
-            self._running = True
+        if self._running.is_set():
+            return
+        self._running.set()
 
         if not self._open_device():
-            with QMutexLocker(self._mutex):
-                self._running = False
+            self._running.clear()
             return
 
         self.recording_status.emit(self._recorder.get_recording_status())
         self.connection_status.emit("ACTIVE", self._sample_rate)
         self._samples_processed = 0
-
-        while True:
-            with QMutexLocker(self._mutex):
-                if not self._running:
-                    break
-
+        self._trace_blocks = self._logger.isEnabledFor(logging.DEBUG)
+        self._signal_detector.trace = self._trace_blocks
+        self._start_detector()
+        self._start_reader()
+        # Only after the reader and detection threads exist: new threads
+        # inherit the creator's affinity mask, and those must stay unpinned
+        self._pin_current_thread()
+
+        running = self._running.is_set
+        reported_overflows = self._overflow_count
+        last_overflow_emit = 0.0
+        batch_rows = [row.view(np.float32) for row in self._fft.input]
+        power_scale = 1.0 / (self._fft_avg_count * self._fft_size ** 2)
+        while running():
             self._power_accum.fill(0.0)
             avg_ok = True
+            # One window per row; set_fft_window swaps in a new array
+            window_iq = self._window_iq
 
-            for _ in range(self._fft_avg_count):
-                with QMutexLocker(self._mutex):
-                    if not self._running:
-                        avg_ok = False
-                        break
-
+            # Stop is only checked per row (plus while waiting for a read
+            # block), so a stop lands at most one row late.
+            for row in batch_rows:
                 if not self._read_iq_block():
                     avg_ok = False
                     break
 
-                self._power_accum += self._compute_fft_db()
+                np.multiply(self._iq_buffer.view(np.float32), window_iq, out=row)
 
             if not avg_ok:
                 break
 
-            avg_power = self._power_accum / self._fft_avg_count
-            magnitude_db = 10.0 * np.log10(avg_power + 1e-10)
+            self._accumulate_fft_power()
+
+            # Normalize by FFT size (power scaling) and average count, and
+            # convert to dB, in a single pass into the next ring buffer
+            magnitude_db = self._row_ring[self._row_ring_idx]
+            power_to_db(self._power_accum, power_scale, magnitude_db)
+            if not self._shift_in_window:
+                # Per-bin values, so shifting the row equals shifting each FFT
+                magnitude_db[:] = np.fft.fftshift(magnitude_db)
             
             # ── Spectrum Analyzer: update stats, peak detection, baseline ──
             try:
@@ -415,26 +689,68 @@ class SDRWorker(QObject):
             except Exception:
                 pass
             
-            # Debug: Log min/max values occasionally
-            if self._samples_processed % (self._sample_rate * 2) < self._fft_size:  # Every ~2 seconds
+            now = time.time()
+
+            # Debug: Log min/max values every ~2 seconds
+            if self._trace_blocks and now - self._last_db_log >= 2.0:
+                self._last_db_log = now
                 self._logger.debug("FFT dB range: min=%.1f, max=%.1f, mean=%.1f", 
                                  np.min(magnitude_db), np.max(magnitude_db), np.mean(magnitude_db))
             
-            self.new_waterfall_row.emit(magnitude_db.astype(np.float32))
+            if self._row_credits.acquire(blocking=False):
+                # Only the slot index crosses threads; no object payload
+                self.new_waterfall_row.emit(self._row_generation, self._row_ring_idx)
+                # A dropped row leaves its buffer free for the next one
+                self._row_ring_idx = (self._row_ring_idx + 1) % self.ROW_RING_SIZE
+
+            if (
+                self._overflow_count != reported_overflows
+                and now - last_overflow_emit >= self.STATUS_EMIT_INTERVAL_SEC
+            ):
+                reported_overflows = self._overflow_count
+                last_overflow_emit = now
+                self.overflow_count_updated.emit(reported_overflows)
 
-            now = time.time()
             if now - self._last_record_status >= 0.5:
                 self._last_record_status = now
-                self.recording_status.emit(self._recorder.get_recording_status())
-
+                # An idle recorder's status only changes on start/stop
+                version = self._recorder.state_version
+                if self._recorder.recording or version != self._last_record_version:
+                    self._last_record_version = version
+                    self.recording_status.emit(self._recorder.get_recording_status())
+
+        # Also reached on a read error, so make sure the reader stops too
+        self._running.clear()
+        self._stop_reader()
+        self._finish_rx_block()
+        self._stop_detector()
         self._close_device()
+        if self._overflow_count != reported_overflows:
+            self.overflow_count_updated.emit(self._overflow_count)
         self.recording_status.emit(self._recorder.get_recording_status())
 
+    @property
+    def row_ring(self) -> list:
+        """Float32 dB row buffers that new_waterfall_row indexes into."""
+        return self._row_ring
+
+    @property
+    def row_generation(self) -> int:
+        """Tag carried by this worker's new_waterfall_row emits."""
+        return self._row_generation
+
+    def row_consumed(self):
+        """Return a waterfall row credit; called once the GUI has taken a row."""
+        try:
+            self._row_credits.release()
+        except ValueError:
+            # More credits returned than rows emitted; never exceed the cap
+            pass
+
     @pyqtSlot()
     def stop_capture(self):
         """Signal the capture loop to stop."""
-        with QMutexLocker(self._mutex):
-            self._running = False
+        self._running.clear()
         self.recording_status.emit(self._recorder.get_recording_status())
 
     def start_recording(self, center_freq, sample_rate, gain_lna, gain_vga):
@@ -460,12 +776,11 @@ class SDRWorker(QObject):
             center_freq: New center frequency in Hz.
             sample_rate: New sample rate in Hz.
         """
-        with QMutexLocker(self._mutex):
-            self._center_freq = center_freq
-            self._sample_rate = sample_rate
-            self._signal_detector.set_sample_rate(sample_rate)
-            self._detector_v2.set_sample_rate(sample_rate)
-            self._spectrum_analyzer.set_sample_rate(sample_rate)
+        self._center_freq = center_freq
+        self._sample_rate = sample_rate
+        self._signal_detector.set_sample_rate(sample_rate)
+        self._detector_v2.set_sample_rate(sample_rate)
+        self._spectrum_analyzer.set_sample_rate(sample_rate)
 
         if self._sdr is not None:
             try:
@@ -475,6 +790,9 @@ class SDRWorker(QObject):
                 self._logger.exception("Retune failed")
                 self.error_occurred.emit(f"Retune failed: {exc}")
 
+        # Drop samples already read at the old tuning
+        self._rx_generation += 1
+
     @pyqtSlot(int, int)
     def set_gains(self, gain_lna: int, gain_vga: int):
         """Update LNA and VGA gains live.
@@ -483,9 +801,8 @@ class SDRWorker(QObject):
             gain_lna: LNA gain in dB.
             gain_vga: VGA gain in dB.
         """
-        with QMutexLocker(self._mutex):
-            self._gain_lna = gain_lna
-            self._gain_vga = gain_vga
+        self._gain_lna = gain_lna
+        self._gain_vga = gain_vga
 
         if self._sdr is not None:
             try:
@@ -531,8 +848,24 @@ class SDRWorker(QObject):
         """Reset peak hold max/min in the spectrum analyzer."""
         self._spectrum_analyzer.reset_peak_hold()
 
+    def _load_window(self, window_name: str) -> np.ndarray:
+        """Build the named window, sign-folded and lane-repeated, in a new array."""
+        window = get_window(window_name, self._fft_size)
+        if self._shift_in_window:
+            window = window.copy()
+            window[1::2] *= -1.0
+        window_iq = empty_aligned(2 * self._fft_size, np.float32)
+        window_iq[0::2] = window
+        window_iq[1::2] = window
+        return window_iq
+
     def set_fft_window(self, window_name: str):
-        """Change the FFT window function (hanning, hamming, blackman, etc.)."""
+        """Change the FFT window function (hanning, hamming, blackman, etc.).
+
+        Safe to call from any thread: the new window is built aside and
+        swapped in by reference, and the capture loop picks it up per row.
+        """
+        self._window_iq = self._load_window(window_name)
         self._spectrum_analyzer.set_window(window_name)
         self._logger.info(" FFT window changed to: %s", window_name)
 
@@ -547,8 +880,7 @@ class SDRWorker(QObject):
     @property
     def is_running(self) -> bool:
         """Whether the capture loop is currently active."""
-        with QMutexLocker(self._mutex):
-            return self._running
+        return self._running.is_set()
     
     def generate_and_transmit(
         self,
@@ -641,14 +973,15 @@ class SDRWorker(QObject):
             # Activate stream
             tx_sdr.activateStream(tx_stream)
             
-            # Convert to complex64 if needed
-            if iq_samples.dtype != np.complex64:
-                iq_samples = iq_samples.astype(np.complex64)
+            # Convert only when needed; complex64 input is sliced in place
+            if iq_samples.dtype != np.complex64 or not iq_samples.flags.c_contiguous:
+                iq_samples = np.ascontiguousarray(iq_samples, dtype=np.complex64)
             
             # Transmit in chunks
-            chunk_size = 1024
+            chunk_size = self.TX_CHUNK_SAMPLES
             total_samples = len(iq_samples)
             samples_sent = 0
+            last_progress_emit = time.monotonic()
             
             while samples_sent < total_samples:
                 chunk_end = min(samples_sent + chunk_size, total_samples)
@@ -663,12 +996,14 @@ class SDRWorker(QObject):
                 
                 samples_sent += sr.ret
                 
-                # Emit progress
-                progress = samples_sent / total_samples
-                self.tx_progress.emit(progress)
-                
-                # Small delay to avoid overwhelming the device
-                time.sleep(0.001)
+                # writeStream blocks until the HackRF has room, so it paces
+                # the loop itself; progress only needs to go out now and then
+                now = time.monotonic()
+                if now - last_progress_emit >= self.STATUS_EMIT_INTERVAL_SEC:
+                    last_progress_emit = now
+                    self.tx_progress.emit(samples_sent / total_samples)
+            
+            self.tx_progress.emit(1.0)
             
             # Deactivate and close TX stream
             tx_sdr.deactivateStream(tx_stream)
@@ -15,17 +15,20 @@ iq_samples = iq_samples + noise
 
 print("=== Signal Detector Debug ===\n")
 
-# Step 1: Calculate power (LINEAR)
-power = np.abs(iq_samples) ** 2
+# Step 1: Calculate power (LINEAR), as re^2 + im^2 (no sqrt from np.abs)
+power = iq_samples.real * iq_samples.real
+power += iq_samples.imag * iq_samples.imag
 print(f"1. Linear power calculation:")
-print(f"   power = np.abs(iq_samples) ** 2")
+print(f"   power = re**2 + im**2")
 print(f"   Min power: {np.min(power):.2e}")
 print(f"   Max power: {np.max(power):.2e}")
 print(f"   Mean power: {np.mean(power):.2e}")
 print()
 
-# Step 2: Convert to dB
-power_db = 10 * np.log10(power + 1e-10)
+# Step 2: Convert to dB, in place (linear power isn't needed past step 1)
+power += 1e-10
+power_db = np.log10(power, out=power)
+power_db *= 10.0
 print(f"2. Convert to dB:")
 print(f"   power_db = 10 * np.log10(power + 1e-10)")
 print(f"   Min power_db: {np.min(power_db):.1f} dB")
@@ -33,9 +36,9 @@ print(f"   Max power_db: {np.max(power_db):.1f} dB")
 print(f"   Mean power_db: {np.mean(power_db):.1f} dB")
 print()
 
-# Step 3: Estimate noise floor
-sorted_power = np.sort(power_db)
-median_noise = np.median(sorted_power[:len(sorted_power)//2])
+# Step 3: Estimate noise floor (median of the lower half; partition, no full sort)
+half = len(power_db) // 2
+median_noise = np.median(np.partition(power_db, half)[:half])
 print(f"3. Noise floor estimation:")
 print(f"   median_noise = {median_noise:.1f} dB")
 print()
@@ -1,5 +1,7 @@
 """Test the fixed signal detector."""
 
+from collections import deque
+
 import numpy as np
 
 # Simulate what's happening with the fix
@@ -9,16 +11,23 @@ noise_samples = 900
 signal_samples = 100
 total_samples = noise_samples + signal_samples
 
-# Noise: very low amplitude
+# complex64 like the SDR delivers; noise and signal are written straight
+# into their halves of the one buffer
+iq_samples = np.empty(total_samples, dtype=np.complex64)
+rng = np.random.default_rng(0)
+
+# Noise: very low amplitude (I and Q drawn in one call over the float32 view)
 noise_amplitude = 0.0001
-noise = noise_amplitude * (np.random.randn(noise_samples) + 1j * np.random.randn(noise_samples))
+noise = iq_samples[:noise_samples]
+rng.standard_normal(dtype=np.float32, out=noise.view(np.float32))
+noise *= np.float32(noise_amplitude)
 
 # Signal: much stronger amplitude (simulating -50 dBm vs -99 dBm noise)
 signal_amplitude = 0.003  # About 30 dB stronger than noise
-signal = signal_amplitude * np.exp(1j * 2 * np.pi * 0.1 * np.arange(signal_samples))
-
-# Combine: mostly noise with a burst of signal
-iq_samples = np.concatenate([noise, signal])
+t = np.arange(signal_samples, dtype=np.float32)
+signal = iq_samples[noise_samples:]
+np.exp(1j * np.float32(2 * np.pi * 0.1) * t, out=signal)
+signal *= np.float32(signal_amplitude)
 
 print("=== Testing Fixed Signal Detector ===\n")
 print(f"Simulated data: {noise_samples} noise samples + {signal_samples} signal samples")
@@ -34,14 +43,26 @@ print(f"  Max: {np.max(power_db):.1f} dB")
 print(f"  Mean: {np.mean(power_db):.1f} dB")
 print()
 
-# OLD METHOD: Median of lower 50%
-sorted_power = np.sort(power_db)
-median_noise_old = np.median(sorted_power[:len(sorted_power)//2])
+# OLD METHOD: Median of lower 50% (partition, no full sort)
+half = len(power_db) // 2
+median_noise_old = np.median(np.partition(power_db, half)[:half])
 print(f"OLD noise floor (median of lower 50%): {median_noise_old:.1f} dB")
 
 # NEW METHOD: 10th percentile
-noise_estimate_new = np.percentile(sorted_power, 10)
+noise_estimate_new = np.percentile(power_db, 10)
 print(f"NEW noise floor (10th percentile): {noise_estimate_new:.1f} dB")
+
+# CASCADED METHOD: two-stage running median over short frames. A 3-frame
+# median rejects transients, and a 64-entry median of that tracks the
+# floor, so up to 31 signal-contaminated frames don't move the estimate.
+frame_len = 50
+short_stage = deque(maxlen=3)
+long_stage = deque(maxlen=64)
+for start in range(0, total_samples, frame_len):
+    short_stage.append(np.median(power_db[start:start + frame_len]))
+    long_stage.append(np.median(short_stage))
+noise_estimate_cascaded = np.median(long_stage)
+print(f"CASCADED noise floor (3 -> 64 frame median): {noise_estimate_cascaded:.1f} dB")
 print()
 
 # Test detection with both methods
@@ -68,6 +89,14 @@ print(f"  Absolute threshold: {absolute_threshold_new:.1f} dB")
 print(f"  Samples detected: {detected_new} / {total_samples}")
 print()
 
+# CASCADED method
+absolute_threshold_cascaded = noise_estimate_cascaded + threshold_db
+detected_cascaded = np.sum(power_db > absolute_threshold_cascaded)
+print(f"CASCADED METHOD:")
+print(f"  Absolute threshold: {absolute_threshold_cascaded:.1f} dB")
+print(f"  Samples detected: {detected_cascaded} / {total_samples}")
+print()
+
 if detected_new > 0:
     print("✅ SUCCESS! Signal detection is now working!")
     print(f"   Expected ~{signal_samples} detections, got {detected_new}")
@@ -0,0 +1,61 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from utils.fft_engine import FFTEngine, accumulate_power, empty_aligned, power_to_db
+
+
+def test_fft_engine_matches_numpy():
+    rng = np.random.default_rng(0)
+    samples = (rng.standard_normal(1024) + 1j * rng.standard_normal(1024)).astype(np.complex64)
+
+    engine = FFTEngine(1024)
+    engine.input[:] = samples
+    spectrum = engine.execute()
+
+    np.testing.assert_allclose(spectrum, np.fft.fft(samples), rtol=1e-4, atol=1e-3)
+
+
+def test_accumulate_power_adds_magnitude_squared():
+    spectrum = np.array([3 + 4j, 1 - 1j, 0j], dtype=np.complex64)
+    accum = np.ones(3, dtype=np.float64)
+
+    accumulate_power(spectrum, accum, np.empty(3, dtype=np.float32))
+
+    np.testing.assert_allclose(accum, [26.0, 3.0, 1.0])
+
+
+def test_batched_fft_and_power_sum_rows():
+    rng = np.random.default_rng(1)
+    samples = (rng.standard_normal((4, 256)) + 1j * rng.standard_normal((4, 256))).astype(np.complex64)
+
+    engine = FFTEngine(256, batch=4)
+    engine.input[:] = samples
+    spectrum = engine.execute()
+    accum = np.zeros(256, dtype=np.float32)
+    accumulate_power(spectrum, accum, np.empty((4, 256), dtype=np.float32))
+
+    expected = (np.abs(np.fft.fft(samples, axis=-1)) ** 2).sum(axis=0)
+    np.testing.assert_allclose(accum, expected, rtol=1e-3)
+
+
+def test_power_to_db_scales_and_converts():
+    accum = np.array([4.0, 0.0, 400.0], dtype=np.float32)
+    out = np.empty(3, dtype=np.float32)
+
+    power_to_db(accum, 0.25, out)
+
+    np.testing.assert_allclose(out, [0.0, -100.0, 20.0], atol=1e-3)
+
+
+def test_empty_aligned_is_simd_aligned():
+    buf = empty_aligned((4, 100), np.float32)
+
+    assert buf.shape == (4, 100)
+    assert buf.dtype == np.float32
+    assert buf.ctypes.data % 32 == 0
@@ -0,0 +1,116 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import radio.iq_player as iq_player
+
+
+class FakeHackRF:
+    """Single-open device: a second open fails until the first handle is dropped."""
+
+    open_handles = 0
+    total_written = 0
+
+    def __init__(self, args):
+        if FakeHackRF.open_handles:
+            raise RuntimeError("hackrf busy")
+        FakeHackRF.open_handles += 1
+        self.written = 0
+
+    def __del__(self):
+        FakeHackRF.open_handles -= 1
+
+    def setSampleRate(self, *args):
+        pass
+
+    def setFrequency(self, *args):
+        pass
+
+    def setGain(self, *args):
+        pass
+
+    def setupStream(self, *args):
+        return object()
+
+    def activateStream(self, stream):
+        pass
+
+    def deactivateStream(self, stream):
+        pass
+
+    def closeStream(self, stream):
+        pass
+
+    def writeStream(self, stream, buffs, count, timeoutUs=0):
+        self.written += count
+        FakeHackRF.total_written += count
+        return SimpleNamespace(ret=count)
+
+
+def _install_fake_soapy(monkeypatch):
+    monkeypatch.setattr(iq_player, "SDR_AVAILABLE", True)
+    monkeypatch.setattr(iq_player, "SoapySDR", SimpleNamespace(Device=FakeHackRF))
+    monkeypatch.setattr(iq_player, "SOAPY_SDR_TIMEOUT", -1)
+    monkeypatch.setattr(FakeHackRF, "total_written", 0)
+
+
+def _recording(tmp_path, count=40000):
+    path = tmp_path / "capture.iq"
+    np.ones(count, dtype=np.complex64).tofile(path)
+    metadata = {"center_freq_hz": 433.92e6, "sample_rate_hz": 2e6, "gain_vga": 20}
+    return path, metadata
+
+
+def test_device_can_be_reopened_after_playback_finishes(tmp_path, monkeypatch):
+    _install_fake_soapy(monkeypatch)
+    path, metadata = _recording(tmp_path)
+    player = iq_player.IQPlayer()
+    finished = []
+    player.playback_finished.connect(lambda: finished.append(FakeHackRF.open_handles))
+
+    player.play_recording(path, metadata)
+
+    # Released before playback_finished reaches the owner
+    assert finished == [0]
+    assert player.sdr is None
+    reopened = FakeHackRF(dict(driver="hackrf"))
+    del reopened
+
+
+def test_device_is_released_when_playback_errors(tmp_path, monkeypatch):
+    _install_fake_soapy(monkeypatch)
+    path, metadata = _recording(tmp_path)
+
+    def failing_write(self, stream, buffs, count, timeoutUs=0):
+        return SimpleNamespace(ret=-4)
+
+    monkeypatch.setattr(FakeHackRF, "writeStream", failing_write)
+    player = iq_player.IQPlayer()
+    errors = []
+    player.playback_error.connect(errors.append)
+
+    player.play_recording(path, metadata)
+
+    assert errors == ["TX write error: -4"]
+    assert FakeHackRF.open_handles == 0
+
+
+def test_truncated_recording_plays_whole_samples(tmp_path, monkeypatch):
+    _install_fake_soapy(monkeypatch)
+    path, metadata = _recording(tmp_path, count=1000)
+    with open(path, "ab") as file_handle:
+        file_handle.write(b"\x00\x01\x02")
+    player = iq_player.IQPlayer()
+    finished = []
+    player.playback_finished.connect(lambda: finished.append(True))
+
+    player.play_recording(path, metadata)
+
+    assert finished == [True]
+    assert FakeHackRF.total_written == 1000
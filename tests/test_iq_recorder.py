@@ -0,0 +1,69 @@
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from radio.iq_recorder import IQRecorder, _DirectIOWriter
+
+
+def test_direct_io_writer_rejects_writes_after_close(tmp_path):
+    if not hasattr(os, "O_DIRECT"):
+        pytest.skip("O_DIRECT not available on this platform")
+    try:
+        writer = _DirectIOWriter(tmp_path / "capture.iq")
+    except OSError:
+        pytest.skip("filesystem does not accept O_DIRECT writes")
+    data = np.arange(100, dtype=np.uint8)
+    writer.write(data)
+    writer.close()
+    writer.close()
+
+    with pytest.raises(ValueError):
+        writer.write(data)
+    assert (tmp_path / "capture.iq").read_bytes() == data.tobytes()
+
+
+def test_stop_while_writing_keeps_file_and_metadata_consistent(tmp_path):
+    recorder = IQRecorder(base_dir=tmp_path)
+    recorder.start_recording(433.92e6, 2e6, 32, 40)
+    block = np.ones(16384, dtype=np.complex64)
+    stop = threading.Event()
+
+    def writer():
+        while not stop.is_set():
+            recorder.write_samples(block)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        iq_path, meta_path = recorder.stop_recording()
+    finally:
+        stop.set()
+        thread.join()
+
+    metadata = json.loads(Path(meta_path).read_text())
+    assert metadata["file_size_bytes"] == os.path.getsize(iq_path)
+    assert metadata["samples_written"] * 8 == metadata["file_size_bytes"]
+
+
+def test_status_does_not_wait_for_a_write_in_progress(tmp_path):
+    recorder = IQRecorder(base_dir=tmp_path, direct_io=False)
+    recorder.start_recording(433.92e6, 2e6, 32, 40)
+    recorder.write_samples(np.ones(1000, dtype=np.complex64))
+
+    # Simulate a write stalled on disk while holding the recorder lock
+    with recorder._lock:
+        status = recorder.get_recording_status()
+
+    assert status["recording"] is True
+    assert status["samples"] == 1000
+    recorder.stop_recording()
+    assert recorder.get_recording_status() == {"recording": False}
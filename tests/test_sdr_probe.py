@@ -43,4 +43,46 @@ def test_probe_device_no_hackrf(monkeypatch):
 
     monkeypatch.setattr(sdr_manager, "SoapySDR", DummySoapy)
     manager = sdr_manager.SDRManager()
-    assert manager._probe_device() is False
\ No newline at end of file
+    assert manager._probe_device() is False
+
+def test_constructing_manager_does_not_probe(monkeypatch):
+    monkeypatch.setattr(sdr_manager, "SDR_AVAILABLE", True)
+    started = []
+
+    class DummyPool:
+        @staticmethod
+        def globalInstance():
+            return DummyPool
+
+        @staticmethod
+        def start(task):
+            started.append(task)
+
+    monkeypatch.setattr(sdr_manager, "QThreadPool", DummyPool)
+    manager = sdr_manager.SDRManager()
+    assert started == []
+
+    manager.probe_async()
+    assert len(started) == 1
+
+
+def test_cached_probe_does_not_enumerate_while_async_probe_pending(monkeypatch):
+    monkeypatch.setattr(sdr_manager, "SDR_AVAILABLE", True)
+
+    class DummyPool:
+        @staticmethod
+        def globalInstance():
+            return DummyPool
+
+        @staticmethod
+        def start(task):
+            pass
+
+    monkeypatch.setattr(sdr_manager, "QThreadPool", DummyPool)
+    manager = sdr_manager.SDRManager()
+    enumerations = []
+    monkeypatch.setattr(manager, "_probe_device", lambda: enumerations.append(1) or True)
+
+    manager.probe_async()
+    assert manager._probe_device_cached() is True
+    assert enumerations == []
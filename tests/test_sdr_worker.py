@@ -0,0 +1,58 @@
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from radio.sdr_worker import SDRWorker
+from utils.spectrum_analyzer import get_window
+
+
+def test_skipped_detection_blocks_are_reported_at_stop(monkeypatch):
+    worker = SDRWorker()
+    warnings = []
+    monkeypatch.setattr(worker._logger, "warning", lambda *args: warnings.append(args))
+    # A full pool queued at once is past the backlog the detectors keep up with
+    for buffs in worker._rx_pool:
+        worker._detect_queue.put((buffs, worker._read_block))
+    worker._detect_thread = threading.Thread(target=worker._detect_loop)
+    worker._detect_thread.start()
+
+    worker._stop_detector()
+
+    assert worker._detect_blocks_skipped > 0
+    assert warnings and warnings[0][1] == worker._detect_blocks_skipped
+    # Every block still goes back to the pool
+    assert worker._rx_free.qsize() == len(worker._rx_pool)
+
+
+def test_fft_window_change_swaps_in_a_new_array():
+    worker = SDRWorker(fft_size=1024)
+    for name in ("blackman", "rectangular"):
+        before = worker._window_iq
+        snapshot = before.copy()
+        worker.set_fft_window(name)
+        # A row in progress keeps reading the old array, untouched
+        assert worker._window_iq is not before
+        np.testing.assert_array_equal(before, snapshot)
+        # Raw window (no gain normalization), sign-folded, per I/Q lane
+        expected = get_window(name, 1024).copy()
+        expected[1::2] *= -1.0
+        np.testing.assert_array_equal(worker._window_iq[0::2], expected)
+        np.testing.assert_array_equal(worker._window_iq[1::2], expected)
+
+def test_row_credits_never_exceed_rows_in_flight():
+    worker = SDRWorker()
+    worker.row_consumed()
+    acquired = 0
+    while worker._row_credits.acquire(blocking=False):
+        acquired += 1
+    assert acquired == SDRWorker.MAX_ROWS_IN_FLIGHT
+
+
+def test_each_worker_tags_rows_with_its_own_generation():
+    assert SDRWorker().row_generation != SDRWorker().row_generation
@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from utils.signal_detector import SignalDetector
+
+
+def _noise_with_burst(total, start, length):
+    rng = np.random.default_rng(0)
+    samples = (0.001 * (rng.standard_normal(total) + 1j * rng.standard_normal(total))).astype(np.complex64)
+    samples[start : start + length] += 0.5
+    return samples
+
+
+def _run(detector, samples, batch=1024):
+    detected = []
+    for start in range(0, len(samples), batch):
+        detected.extend(detector.process_samples(samples[start : start + batch].copy()))
+    return detected
+
+
+def test_burst_inside_one_batch_includes_hysteresis_tail():
+    detector = SignalDetector(sample_rate=2e6, hysteresis_samples=50)
+    detector.noise_floor_db = 0.0
+
+    detected = _run(detector, _noise_with_burst(2048, 300, 400))
+
+    assert len(detected) == 1
+    assert detected[0]["start_sample"] == 300
+    assert detected[0]["duration_sec"] == (400 + 50) / 2e6
+
+
+def test_burst_spanning_batches_is_joined():
+    detector = SignalDetector(sample_rate=2e6, hysteresis_samples=50)
+    detector.noise_floor_db = 0.0
+
+    detected = _run(detector, _noise_with_burst(4096, 900, 1500))
+
+    assert len(detected) == 1
+    assert detected[0]["start_sample"] == 900
+    assert detected[0]["duration_sec"] == (1500 + 50) / 2e6
@@ -6,18 +6,30 @@ messages simulating aircraft in the area. Use this to test the
 ADS-B tab when no real dump1090/HackRF is available.
 
 Usage:
-    python tools/adsb_test_feed.py
+    python tools/adsb_test_feed.py [--aircraft N]
+
+--aircraft pads the built-in aircraft with random ones up to N, for load
+testing the ADS-B tab. Propagation runs as a Numba kernel when Numba is
+installed, which matters at thousands of aircraft.
 
 Then press START on the ADS-B tab - it will connect to localhost:30003.
 """
 
+import argparse
+import math
 import socket
 import time
-import math
-import random
 import threading
 import sys
 
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Simulated aircraft definitions
 AIRCRAFT = [
     {"icao": "A1B2C3", "callsign": "UAL1234", "lat": 32.90, "lon": -96.80, "alt_ft": 35000, "speed_kts": 450, "heading": 270, "vrate_fpm": 0},
@@ -31,43 +43,115 @@ AIRCRAFT = [
 ]
 
 
-def update_aircraft(ac, dt_sec):
-    """Move aircraft based on heading and speed."""
-    speed_deg_per_sec = (ac["speed_kts"] / 3600.0) / 60.0  # rough nm->deg
-    heading_rad = math.radians(ac["heading"])
-    
-    ac["lat"] += speed_deg_per_sec * math.cos(heading_rad) * dt_sec
-    ac["lon"] += speed_deg_per_sec * math.sin(heading_rad) * dt_sec
-    ac["alt_ft"] += ac["vrate_fpm"] / 60.0 * dt_sec
-    
-    # Add slight heading drift
-    ac["heading"] = (ac["heading"] + random.uniform(-0.5, 0.5)) % 360
-    
-    # Clamp altitude
-    ac["alt_ft"] = max(1000, min(45000, ac["alt_ft"]))
+# PCG64; every tick's random draws are made as whole-fleet batches
+RNG = np.random.default_rng()
+
+VRATE_CHOICES_FPM = np.array([0, 0, 0, 500, -500, 1000, -1000, 1500, -1500], dtype=float)
+
+# Kinematic state as one array per field (index i is aircraft i), so a
+# tick updates every aircraft in a handful of vectorized operations
+STATE_FIELDS = ("lat", "lon", "alt_ft", "speed_kts", "heading", "vrate_fpm")
+
+
+def make_fleet(aircraft):
+    """Split aircraft definitions into identity lists and per-field arrays."""
+    fleet = {field: np.array([ac[field] for ac in aircraft], dtype=float) for field in STATE_FIELDS}
+    fleet["icao"] = [ac["icao"] for ac in aircraft]
+    fleet["callsign"] = [ac["callsign"] for ac in aircraft]
+    # Pre-encoded once; messages are built directly as ASCII bytes
+    fleet["icao_b"] = [icao.encode("ascii") for icao in fleet["icao"]]
+    fleet["callsign_b"] = [callsign.encode("ascii") for callsign in fleet["callsign"]]
+    return fleet
+
+
+def synthetic_aircraft(count):
+    """Random aircraft around the built-in ones, for load testing."""
+    fields = zip(
+        RNG.uniform(32.5, 33.3, count).tolist(),
+        RNG.uniform(-97.3, -96.4, count).tolist(),
+        RNG.uniform(2000, 42000, count).tolist(),
+        RNG.uniform(100, 520, count).tolist(),
+        RNG.uniform(0, 360, count).tolist(),
+        RNG.choice(VRATE_CHOICES_FPM, count).tolist(),
+    )
+    return [
+        {"icao": f"{0xAA0000 + n:06X}", "callsign": f"TST{n:04d}", "lat": lat, "lon": lon,
+         "alt_ft": alt_ft, "speed_kts": speed_kts, "heading": heading, "vrate_fpm": vrate_fpm}
+        for n, (lat, lon, alt_ft, speed_kts, heading, vrate_fpm) in enumerate(fields)
+    ]
+
+
+FLEET = make_fleet(AIRCRAFT)
+
+
+if NUMBA_AVAILABLE:
+
+    # Serial on purpose: every client thread calls this, and Numba's
+    # workqueue threading layer (used when neither TBB nor OpenMP is
+    # installed) aborts on concurrent parallel regions. A fused loop is
+    # already far below a tick for thousands of aircraft.
+    @njit(fastmath=True, cache=True)
+    def _propagate(lat, lon, alt_ft, speed_kts, heading, vrate_fpm, drift, dt_sec):
+        # One fused pass per aircraft; random draws are made by the caller
+        for i in range(lat.size):
+            speed_deg_per_sec = (speed_kts[i] / 3600.0) / 60.0
+            heading_rad = math.radians(heading[i])
+            lat[i] += speed_deg_per_sec * math.cos(heading_rad) * dt_sec
+            lon[i] += speed_deg_per_sec * math.sin(heading_rad) * dt_sec
+            alt_ft[i] = min(45000.0, max(1000.0, alt_ft[i] + vrate_fpm[i] / 60.0 * dt_sec))
+            heading[i] = (heading[i] + drift[i]) % 360.0
+
+
+def update_aircraft(fleet, dt_sec):
+    """Move all aircraft based on heading and speed."""
+    count = len(fleet["icao"])
+    # Slight heading drift
+    drift = RNG.uniform(-0.5, 0.5, count)
+
+    if NUMBA_AVAILABLE:
+        _propagate(fleet["lat"], fleet["lon"], fleet["alt_ft"], fleet["speed_kts"],
+                   fleet["heading"], fleet["vrate_fpm"], drift, dt_sec)
+    else:
+        speed_deg_per_sec = (fleet["speed_kts"] / 3600.0) / 60.0  # rough nm->deg
+        heading_rad = np.deg2rad(fleet["heading"])
+        
+        fleet["lat"] += speed_deg_per_sec * np.cos(heading_rad) * dt_sec
+        fleet["lon"] += speed_deg_per_sec * np.sin(heading_rad) * dt_sec
+        fleet["alt_ft"] += fleet["vrate_fpm"] / 60.0 * dt_sec
+        
+        fleet["heading"] += drift
+        fleet["heading"] %= 360
+        
+        # Clamp altitude
+        np.clip(fleet["alt_ft"], 1000, 45000, out=fleet["alt_ft"])
     
     # Occasionally change vertical rate
-    if random.random() < 0.02:
-        ac["vrate_fpm"] = random.choice([0, 0, 0, 500, -500, 1000, -1000, 1500, -1500])
+    change = RNG.random(count) < 0.02
+    fleet["vrate_fpm"][change] = RNG.choice(VRATE_CHOICES_FPM, int(change.sum()))
 
 
-def generate_sbs_messages(ac):
-    """Generate SBS BaseStation format messages for one aircraft."""
-    now = time.strftime("%Y/%m/%d,%H:%M:%S.000")
-    msgs = []
-    
-    # MSG type 1: callsign
-    msgs.append(f"MSG,1,1,1,{ac['icao']},{ac['icao']},{now},{now},{ac['callsign']},,,,,,,,,,\n")
-    
-    # MSG type 3: position + altitude
-    msgs.append(f"MSG,3,1,1,{ac['icao']},{ac['icao']},{now},{now},,{ac['alt_ft']:.0f},,,"
-                f"{ac['lat']:.6f},{ac['lon']:.6f},,,0,0,0,0\n")
+def generate_sbs_messages(fleet):
+    """Generate one tick of SBS BaseStation messages for every aircraft, as ASCII bytes."""
+    now = time.strftime("%Y/%m/%d,%H:%M:%S.000").encode("ascii")
+    buf = bytearray()
+    rows = zip(
+        fleet["icao_b"], fleet["callsign_b"], fleet["lat"].tolist(), fleet["lon"].tolist(),
+        fleet["alt_ft"].tolist(), fleet["speed_kts"].tolist(), fleet["heading"].tolist(),
+        fleet["vrate_fpm"].tolist(),
+    )
+    for icao, callsign, lat, lon, alt_ft, speed_kts, heading, vrate_fpm in rows:
+        # MSG type 1: callsign
+        buf += b"MSG,1,1,1,%s,%s,%s,%s,%s,,,,,,,,,,\n" % (icao, icao, now, now, callsign)
+        
+        # MSG type 3: position + altitude
+        buf += b"MSG,3,1,1,%s,%s,%s,%s,,%.0f,,,%.6f,%.6f,,,0,0,0,0\n" % (
+            icao, icao, now, now, alt_ft, lat, lon)
+        
+        # MSG type 4: velocity
+        buf += b"MSG,4,1,1,%s,%s,%s,%s,,,%.0f,%.1f,,,%.0f,,,,\n" % (
+            icao, icao, now, now, speed_kts, heading, vrate_fpm)
     
-    # MSG type 4: velocity
-    msgs.append(f"MSG,4,1,1,{ac['icao']},{ac['icao']},{now},{now},,,{ac['speed_kts']:.0f},"
-                f"{ac['heading']:.1f},,,{ac['vrate_fpm']:.0f},,,,\n")
-    
-    return msgs
+    return buf
 
 
 def handle_client(conn, addr):
@@ -75,11 +159,9 @@ def handle_client(conn, addr):
     print(f"[+] Client connected: {addr}")
     try:
         while True:
-            for ac in AIRCRAFT:
-                update_aircraft(ac, 1.0)
-                msgs = generate_sbs_messages(ac)
-                for msg in msgs:
-                    conn.sendall(msg.encode("ascii"))
+            update_aircraft(FLEET, 1.0)
+            # One send per tick for the whole fleet
+            conn.sendall(generate_sbs_messages(FLEET))
             time.sleep(1.0)
     except (BrokenPipeError, ConnectionResetError, OSError):
         print(f"[-] Client disconnected: {addr}")
@@ -88,6 +170,14 @@ def handle_client(conn, addr):
 
 
 def main():
+    global FLEET
+
+    parser = argparse.ArgumentParser(description="Simulated ADS-B SBS feed on localhost:30003")
+    parser.add_argument("--aircraft", type=int, default=len(AIRCRAFT),
+                        help="total aircraft to simulate (pads with random ones)")
+    args = parser.parse_args()
+    FLEET = make_fleet(AIRCRAFT + synthetic_aircraft(max(0, args.aircraft - len(AIRCRAFT))))
+
     host = "127.0.0.1"
     port = 30003
     
@@ -105,7 +195,7 @@ def main():
     print(f"=" * 60)
     print(f"  ADS-B Test Feed Server")
     print(f"  SBS BaseStation format on {host}:{port}")
-    print(f"  Simulating {len(AIRCRAFT)} aircraft")
+    print(f"  Simulating {len(FLEET['icao'])} aircraft")
     print(f"=" * 60)
     print(f"Now press START on the ADS-B tab in RF Tactical Monitor.")
     print(f"Press Ctrl+C to stop.\n")
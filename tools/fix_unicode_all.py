@@ -19,6 +19,8 @@ replacements = {
     '\u2026': '...',    # …
     '\u2022': '*',      # •
 }
+# Every key is one code point, so all replacements run in one translate pass
+table = str.maketrans(replacements)
 
 fixed = 0
 for root, dirs, files in os.walk(base):
@@ -27,11 +29,16 @@ for root, dirs, files in os.walk(base):
         if not fn.endswith('.py'):
             continue
         fp = os.path.join(root, fn)
-        with open(fp, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(fp, 'rb') as f:
+            raw = f.read()
+        # Nothing to replace in pure-ASCII files (most of them); skip the
+        # decode entirely
+        if raw.isascii():
+            continue
+        # Same newline handling as reading in text mode
+        content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
         orig = content
-        for old, new in replacements.items():
-            content = content.replace(old, new)
+        content = content.translate(table)
         if content != orig:
             with open(fp, 'w', encoding='utf-8') as f:
                 f.write(content)
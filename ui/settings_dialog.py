@@ -24,6 +24,7 @@ from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 
 from utils.config import ConfigManager
+from utils.spectrum_analyzer import WINDOW_FUNCTIONS
 
 
 class SettingsDialog(QDialog):
@@ -205,6 +206,14 @@ class SettingsDialog(QDialog):
         row.addWidget(self.colormap_combo, 1)
         layout.addLayout(row)
 
+        row = QHBoxLayout()
+        row.addWidget(QLabel("FFT WINDOW"))
+        self.fft_window_combo = QComboBox()
+        self.fft_window_combo.addItems([name.upper() for name in WINDOW_FUNCTIONS])
+        self.fft_window_combo.setMinimumHeight(44)
+        row.addWidget(self.fft_window_combo, 1)
+        layout.addLayout(row)
+
         return group
 
     def _make_toggle(self, label: str) -> QCheckBox:
@@ -240,6 +249,10 @@ class SettingsDialog(QDialog):
         if idx >= 0:
             self.colormap_combo.setCurrentIndex(idx)
 
+        idx = self.fft_window_combo.findText(self._config.waterfall.fft_window.upper())
+        if idx >= 0:
+            self.fft_window_combo.setCurrentIndex(idx)
+
     def _apply_backlight(self, value: int) -> None:
         """Apply brightness to backlight file if available."""
         if self._backlight_path is None or not os.path.exists(self._backlight_path):
@@ -270,6 +283,7 @@ class SettingsDialog(QDialog):
 
         self._config.display.brightness = int(self.brightness_slider.value())
         self._config.waterfall.colormap = self.colormap_combo.currentText()
+        self._config.waterfall.fft_window = self.fft_window_combo.currentText().lower()
 
         self._apply_backlight(self._config.display.brightness)
         self._config.save_settings()
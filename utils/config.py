@@ -58,13 +58,15 @@ class DisplaySettings:
 class WaterfallSettings:
     """Waterfall display settings."""
     colormap: str
+    fft_window: str = "hanning"
 
 
 @dataclass
 class SDRSettings:
-    """SDR gain settings."""
+    """SDR gain and FFT loop settings."""
     gain_lna: int
     gain_vga: int
+    fft_cpu_core: Optional[int] = None
 
 
 @dataclass
@@ -163,12 +165,18 @@ class ConfigManager:
         waterfall_data = data.get("waterfall_settings", {})
         self._waterfall = WaterfallSettings(
             colormap=str(waterfall_data.get("colormap", "TACTICAL PURPLE")),
+            fft_window=str(waterfall_data.get("fft_window", "hanning")),
         )
 
         sdr_data = data.get("sdr_settings", {})
         self._sdr = SDRSettings(
             gain_lna=int(sdr_data.get("gain_lna", 32)),
             gain_vga=int(sdr_data.get("gain_vga", 40)),
+            fft_cpu_core=(
+                int(sdr_data["fft_cpu_core"])
+                if sdr_data.get("fft_cpu_core") is not None
+                else None
+            ),
         )
 
         decoder_data = data.get("decoder_settings", {})
@@ -270,10 +278,12 @@ class ConfigManager:
             },
             "waterfall_settings": {
                 "colormap": self._waterfall.colormap,
+                "fft_window": self._waterfall.fft_window,
             },
             "sdr_settings": {
                 "gain_lna": self._sdr.gain_lna,
                 "gain_vga": self._sdr.gain_vga,
+                "fft_cpu_core": self._sdr.fft_cpu_core,
             },
             "decoder_settings": {
                 "adsb_enabled": self._decoder.adsb_enabled,
@@ -0,0 +1,281 @@
+"""RF Tactical Monitor - FFT Engine
+
+Fixed-size forward FFT for the SDR worker's waterfall path, optionally
+batched over several blocks at once.
+
+Uses a pyFFTW plan built once over SIMD-aligned buffers when pyFFTW is
+installed, and falls back to numpy.fft otherwise. FFTW wisdom is kept on
+disk so FFTW_MEASURE planning only runs the first time a shape is seen. The per-bin power
+kernels are compiled with Numba when it is available. When asked to, and
+CuPy finds a CUDA device, the batched FFT and power sum run on the GPU
+instead and only the summed power row is copied back.
+"""
+
+import inspect
+import os
+
+import numpy as np
+
+try:
+    import pyfftw
+    PYFFTW_AVAILABLE = True
+except ImportError:
+    PYFFTW_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import cupy
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+# numpy >= 2.0 can write FFT results into a caller-supplied array
+_NUMPY_FFT_HAS_OUT = "out" in inspect.signature(np.fft.fft).parameters
+
+
+if os.name == "nt":
+    _WISDOM_DIR = os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "rf_tactical")
+else:
+    _WISDOM_DIR = os.path.join(os.path.expanduser("~"), ".cache", "rf_tactical")
+WISDOM_PATH = os.path.join(_WISDOM_DIR, "fftw_wisdom")
+
+_wisdom_loaded = False
+
+
+def _load_wisdom():
+    """Import saved FFTW wisdom once per process; a missing file is fine."""
+    global _wisdom_loaded
+    if _wisdom_loaded:
+        return
+    _wisdom_loaded = True
+    try:
+        with open(WISDOM_PATH, "rb") as f:
+            # Wisdom is plain text per precision; stored NUL-separated
+            pyfftw.import_wisdom(tuple(f.read().split(b"\0")))
+    except (OSError, ValueError, TypeError):
+        pass
+
+
+def _save_wisdom(wisdom):
+    try:
+        os.makedirs(_WISDOM_DIR, exist_ok=True)
+        with open(WISDOM_PATH, "wb") as f:
+            f.write(b"\0".join(wisdom))
+    except OSError:
+        pass
+
+
+def empty_aligned(shape, dtype) -> np.ndarray:
+    """Uninitialized array on a SIMD boundary (pyFFTW's allocator when present)."""
+    if PYFFTW_AVAILABLE:
+        return pyfftw.empty_aligned(shape, dtype=dtype)
+    # numpy allocations are only guaranteed 16-byte aligned; over-allocate
+    # and slice to a 64-byte boundary instead
+    dtype = np.dtype(dtype)
+    count = int(np.prod(shape))
+    raw = np.empty(count * dtype.itemsize + 64, dtype=np.uint8)
+    start = -raw.ctypes.data % 64
+    return raw[start : start + count * dtype.itemsize].view(dtype).reshape(shape)
+
+
+def _gpu_available() -> bool:
+    """Whether CuPy is installed and can see at least one CUDA device."""
+    if not CUPY_AVAILABLE:
+        return False
+    try:
+        return cupy.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        return False
+
+
+class FFTEngine:
+    """Planned forward FFT over a fixed-size complex64 buffer.
+
+    Callers write samples into ``input`` and call ``execute()``, which
+    returns the spectrum. The returned array is the engine's own output
+    buffer and is overwritten by the next call (numpy < 2.0 cannot write
+    into it, so there the fallback returns a new array instead). With
+    ``batch`` set, ``input`` is a (batch, fft_size) matrix and every row
+    is transformed in one call.
+
+    Args:
+        fft_size: Number of FFT bins.
+        threads: FFTW worker threads (ignored by the numpy fallback).
+        batch: Number of rows to transform per call, or None for a single
+            1-D block.
+        use_gpu: Run on a CUDA device through CuPy when one is present;
+            silently stays on the CPU otherwise.
+    """
+
+    def __init__(self, fft_size: int, threads: int = 1, batch: int = None, use_gpu: bool = False):
+        self._fft_size = fft_size
+        self._batch = batch
+        self._gpu = False
+        self._plan = None
+        shape = (batch, fft_size) if batch is not None else (fft_size,)
+
+        if use_gpu and _gpu_available():
+            try:
+                self._init_gpu(shape)
+                return
+            except Exception:
+                self._gpu = False
+
+        if PYFFTW_AVAILABLE:
+            _load_wisdom()
+            wisdom = pyfftw.export_wisdom()
+            self.input = pyfftw.empty_aligned(shape, dtype="complex64")
+            self.output = pyfftw.empty_aligned(shape, dtype="complex64")
+            # FFTW_MEASURE scribbles over the buffers while planning, so plan
+            # before anything is written to them.
+            self._plan = pyfftw.FFTW(
+                self.input,
+                self.output,
+                axes=(-1,),
+                direction="FFTW_FORWARD",
+                flags=("FFTW_MEASURE", "FFTW_DESTROY_INPUT"),
+                threads=threads,
+            )
+            self.input.fill(0)
+            # Only a shape FFTW had to measure adds wisdom worth saving
+            new_wisdom = pyfftw.export_wisdom()
+            if new_wisdom != wisdom:
+                _save_wisdom(new_wisdom)
+        else:
+            self.input = np.zeros(shape, dtype=np.complex64)
+            self.output = np.zeros(shape, dtype=np.complex64)
+
+    def _init_gpu(self, shape):
+        # Page-locked host buffers so uploads and the row download are DMA'd
+        count = int(np.prod(shape))
+        self._pinned_in = cupy.cuda.alloc_pinned_memory(count * np.dtype(np.complex64).itemsize)
+        self.input = np.frombuffer(self._pinned_in, np.complex64, count).reshape(shape)
+        self.input.fill(0)
+        self.output = np.zeros(shape, dtype=np.complex64)
+        self._pinned_row = cupy.cuda.alloc_pinned_memory(self._fft_size * np.dtype(np.float32).itemsize)
+        self._power_row = np.frombuffer(self._pinned_row, np.float32, self._fft_size)
+        self._d_input = cupy.empty(shape, dtype=cupy.complex64)
+        self._gpu = True
+
+    @property
+    def fft_size(self) -> int:
+        """Number of FFT bins."""
+        return self._fft_size
+
+    @property
+    def batch(self):
+        """Rows transformed per call, or None for a 1-D engine."""
+        return self._batch
+
+    @property
+    def backend(self) -> str:
+        """Name of the FFT implementation in use."""
+        if self._gpu:
+            return "cupy"
+        return "pyfftw" if self._plan is not None else "numpy"
+
+    def execute(self) -> np.ndarray:
+        """Transform ``input`` and return the complex spectrum."""
+        if self._gpu:
+            self._d_input.set(self.input)
+            return cupy.fft.fft(self._d_input, axis=-1).get(out=self.output)
+        if self._plan is not None:
+            return self._plan()
+        if _NUMPY_FFT_HAS_OUT:
+            return np.fft.fft(self.input, axis=-1, out=self.output)
+        return np.fft.fft(self.input, axis=-1)
+
+    def accumulate_power(self, accum: np.ndarray, scratch: np.ndarray):
+        """Transform ``input`` and add the power of every row into ``accum``.
+
+        On the GPU the spectrum never leaves the device; only the summed
+        float32 power row is copied back.
+        """
+        if self._gpu:
+            self._d_input.set(self.input)
+            spectrum = cupy.fft.fft(self._d_input, axis=-1)
+            power = spectrum.real ** 2 + spectrum.imag ** 2
+            power.reshape(-1, self._fft_size).sum(axis=0).get(out=self._power_row)
+            accum += self._power_row
+            return
+        accumulate_power(self.execute(), accum, scratch)
+
+
+# ── Power kernels ───────────────────────────────────────────────
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _accumulate_power_rows(rows, accum):
+        for r in range(rows.shape[0]):
+            for i in range(rows.shape[1]):
+                re = rows[r, i].real
+                im = rows[r, i].imag
+                accum[i] += re * re + im * im
+
+    def accumulate_power(spectrum, accum, scratch):
+        """Add |spectrum|^2 to ``accum`` in place, in a single pass.
+
+        ``spectrum`` is one block or a (rows, bins) batch whose rows are all
+        summed into ``accum``. ``scratch`` is only used by the numpy fallback.
+        """
+        _accumulate_power_rows(spectrum.reshape(-1, accum.size), accum)
+
+else:
+
+    def accumulate_power(spectrum, accum, scratch):
+        """Add |spectrum|^2 to ``accum`` in place, using float32 ``scratch``.
+
+        ``spectrum`` is one block or a (rows, bins) batch whose rows are all
+        summed into ``accum``; ``scratch`` has the same shape as ``spectrum``.
+        Works on the real/imag views directly (re*re + im*im), so there is
+        no sqrt from np.abs and no complex temporary.
+        """
+        re = spectrum.real
+        im = spectrum.imag
+        rows = scratch.reshape(-1, accum.size)
+        np.multiply(re, re, out=scratch)
+        accum += rows.sum(axis=0)
+        np.multiply(im, im, out=scratch)
+        accum += rows.sum(axis=0)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def power_to_db(accum, scale, out):
+        """Write ``10*log10(max(accum*scale, 1e-10))`` into float32 ``out``.
+
+        Scalar libm log10 doesn't vectorize here, so log2 is rebuilt from
+        the float32 bits instead: the exponent field plus a 6th-order
+        polynomial for log2 of the mantissa (max error under 2e-5 dB).
+        """
+        bits = out.view(np.int32)
+        for i in range(accum.size):
+            # Floor rather than offset, so weak bins are not biased upward
+            out[i] = max(accum[i] * scale, np.float32(1e-10))
+        for i in range(accum.size):
+            b = bits[i]
+            e = np.float32(((b >> 23) & 0xFF) - 127)
+            # Mantissa with a zero exponent, i.e. a float in [1, 2)
+            bits[i] = (b & 0x7FFFFF) | 0x3F800000
+            m = out[i] - np.float32(1.0)
+            log2_m = m * (np.float32(1.4425449) + m * (np.float32(-0.7181452)
+                     + m * (np.float32(0.4575485) + m * (np.float32(-0.2779042)
+                     + m * (np.float32(0.1217970) + m * np.float32(-0.0258411))))))
+            # 10*log10(x) = 10*log10(2) * log2(x)
+            out[i] = np.float32(3.0102999566) * (e + log2_m)
+
+else:
+
+    def power_to_db(accum, scale, out):
+        """Write ``10*log10(max(accum*scale, 1e-10))`` into float32 ``out``, in place."""
+        np.multiply(accum, scale, out=out)
+        np.maximum(out, np.float32(1e-10), out=out)
+        np.log10(out, out=out)
+        out *= 10.0
@@ -10,6 +10,50 @@ be removed in a future version.
 
 import numpy as np
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _scan_bursts(above, in_signal, below, hysteresis, starts, ends):
+    """Run the burst hysteresis state machine over one batch.
+
+    A burst starts on the first sample above threshold and ends, inclusive
+    of the trailing quiet samples, once ``hysteresis`` samples in a row
+    are below it. Completed bursts are written to ``starts``/``ends`` as
+    half-open index ranges, with start -1 for a burst carried over from
+    the previous batch.
+
+    Returns:
+        (burst count, in_signal, below-threshold run, start index of the
+        still-open burst or -1 if it began in an earlier batch)
+    """
+    count = 0
+    start = -1
+    for i in range(above.shape[0]):
+        if above[i]:
+            if not in_signal:
+                in_signal = True
+                start = i
+            below = 0
+        elif in_signal:
+            below += 1
+            if below >= hysteresis:
+                starts[count] = start
+                ends[count] = i + 1
+                count += 1
+                in_signal = False
+                below = 0
+                start = -1
+    return count, in_signal, below, start
+
+
+if NUMBA_AVAILABLE:
+    # nogil: the detection thread need not hold up the capture loop
+    _scan_bursts = njit(cache=True, nogil=True)(_scan_bursts)
+
 
 class SignalDetector:
     """Detects signal bursts in IQ stream."""
@@ -36,7 +80,8 @@ class SignalDetector:
 
         self.in_signal = False
         self.signal_start_sample = 0
-        self.signal_samples = []
+        self.signal_samples = []  # IQ chunks of the burst in progress
+        self._signal_len = 0
         self.samples_below_threshold = 0  # Counter for hysteresis
         self.continuous_batch_count = 0  # Track how many batches signal has spanned
         self.cooldown_batches = 0  # Cooldown after rejecting continuous signal
@@ -45,6 +90,15 @@ class SignalDetector:
         self.noise_floor_db = -100  # Initial estimate
         self.noise_floor_alpha = 0.01  # Smoothing factor
 
+        # Completed bursts per batch, filled by _scan_bursts; one burst needs
+        # at least hysteresis_samples, so a batch rarely has more than a few
+        self._burst_starts = np.empty(0, dtype=np.int64)
+        self._burst_ends = np.empty(0, dtype=np.int64)
+
+        # Per-batch flow.data diagnostics; one batch is ~0.5 ms of samples,
+        # so these are only worth their logging cost while debugging
+        self.trace = False
+
     def process_samples(self, iq_samples):
         """Process IQ samples and detect signal bursts.
 
@@ -77,87 +131,101 @@ class SignalDetector:
         # Detect signals above noise floor + threshold
         absolute_threshold = self.noise_floor_db + self.threshold_db
         above_threshold = power_db > absolute_threshold
+        if len(self._burst_starts) < len(above_threshold):
+            self._burst_starts = np.empty(len(above_threshold), dtype=np.int64)
+            self._burst_ends = np.empty(len(above_threshold), dtype=np.int64)
         
-        # Debug: Log sample statistics (will be visible in flow tracer)
-        num_above = np.sum(above_threshold)
-        max_power = np.max(power_db)
         from utils.flow_tracer import get_flow_tracer
         flow = get_flow_tracer()
         
-        # ALWAYS log detection stats to see what's happening
-        flow.data("ISM", "samples_above_threshold", f"{num_above}/{len(power_db)}")
-        flow.data("ISM", "max_sample_power", f"{max_power:.1f} dB")
-        flow.data("ISM", "current_threshold", f"{absolute_threshold:.1f} dB")
-        flow.data("ISM", "in_signal_state", f"{self.in_signal}")
-        
-        if num_above > 0:
-            flow.data("ISM", "detection_active", "YES - samples above threshold detected!")
+        if self.trace:
+            # Debug: Log sample statistics (will be visible in flow tracer)
+            num_above = np.sum(above_threshold)
+            max_power = np.max(power_db)
+            flow.data("ISM", "samples_above_threshold", f"{num_above}/{len(power_db)}")
+            flow.data("ISM", "max_sample_power", f"{max_power:.1f} dB")
+            flow.data("ISM", "current_threshold", f"{absolute_threshold:.1f} dB")
+            flow.data("ISM", "in_signal_state", f"{self.in_signal}")
+
+            if num_above > 0:
+                flow.data("ISM", "detection_active", "YES - samples above threshold detected!")
 
         detected_this_batch = []
         
         # Handle cooldown period after rejecting continuous signal
         if self.cooldown_batches > 0:
             self.cooldown_batches -= 1
-            flow.data("ISM", "cooldown_active", f"{self.cooldown_batches} batches remaining")
+            if self.trace:
+                flow.data("ISM", "cooldown_active", f"{self.cooldown_batches} batches remaining")
             return []  # Skip detection during cooldown
 
-        for i, is_signal in enumerate(above_threshold):
-            if is_signal and not self.in_signal:
+        # The per-sample burst state machine runs compiled; only completed
+        # bursts come back to Python, as (start, end) index pairs
+        n_bursts, in_signal, below, open_start = _scan_bursts(
+            above_threshold,
+            self.in_signal,
+            self.samples_below_threshold,
+            self.hysteresis_samples,
+            self._burst_starts,
+            self._burst_ends,
+        )
+        self.samples_below_threshold = below
+
+        bursts = zip(self._burst_starts[:n_bursts].tolist(), self._burst_ends[:n_bursts].tolist())
+        for burst_start, burst_end in bursts:
+            if burst_start < 0:
+                # Began in an earlier batch
+                start_sample = self.signal_start_sample
+                self.signal_samples.append(iq_samples[:burst_end])
+                signal_array = np.concatenate(self.signal_samples)
+            else:
+                start_sample = burst_start
+                self.continuous_batch_count = 0
+                signal_array = iq_samples[burst_start:burst_end]
+            self.signal_samples = []
+            self._signal_len = 0
+
+            duration_sec = len(signal_array) / self.sample_rate
+            
+            # Check duration limits
+            if len(signal_array) < self.min_duration_samples:
+                flow.warning("ISM", f"[X] Signal REJECTED (too short): {len(signal_array)} samples ({duration_sec*1000:.2f}ms) < {self.min_duration_sec*1000:.2f}ms required")
+            elif len(signal_array) > self.max_duration_samples:
+                flow.warning("ISM", f"[X] Signal REJECTED (too long): {len(signal_array)} samples ({duration_sec*1000:.2f}ms) > {self.max_duration_sec*1000:.2f}ms max")
+            else:
+                # Valid duration - accept signal
+                peak_power = np.max(np.abs(signal_array) ** 2)
+                # Apply same +40 dB offset as detection calculation
+                peak_power_db = 10 * np.log10(peak_power + 1e-10) + 40.0
+
+                fft = np.fft.fft(signal_array)
+                fft_freqs = np.fft.fftfreq(len(signal_array), 1 / self.sample_rate)
+                center_freq_offset = fft_freqs[np.argmax(np.abs(fft))]
+
+                flow.success("ISM", f"[OK] Signal ACCEPTED: {len(signal_array)} samples, {duration_sec*1000:.2f}ms, {peak_power_db:.1f} dB")
+
+                detected_this_batch.append(
+                    {
+                        "start_sample": start_sample,
+                        "duration_sec": duration_sec,
+                        "peak_power_dbm": peak_power_db,
+                        "center_freq_offset_hz": center_freq_offset,
+                    }
+                )
+
+        if in_signal:
+            if open_start >= 0:
                 # Start of new signal
-                self.in_signal = True
-                self.signal_start_sample = i
-                self.signal_samples = [iq_samples[i]]
-                self.samples_below_threshold = 0
+                self.signal_start_sample = open_start
                 self.continuous_batch_count = 0  # Reset batch counter for new signal
-            elif is_signal and self.in_signal:
-                # Continue signal - sample above threshold
-                self.signal_samples.append(iq_samples[i])
-                self.samples_below_threshold = 0  # Reset counter
-            elif not is_signal and self.in_signal:
-                # Sample below threshold while in signal - use hysteresis
-                self.samples_below_threshold += 1
-                self.signal_samples.append(iq_samples[i])  # Include in signal
-                
-                # Only end signal if we've been below threshold for hysteresis_samples
-                if self.samples_below_threshold >= self.hysteresis_samples:
-                    self.in_signal = False
-                    self.samples_below_threshold = 0
-
-                    # Debug logging
-                    from utils.flow_tracer import get_flow_tracer
-                    flow = get_flow_tracer()
-                    
-                    duration_sec = len(self.signal_samples) / self.sample_rate
-                    
-                    # Check duration limits
-                    if len(self.signal_samples) < self.min_duration_samples:
-                        flow.warning("ISM", f"[X] Signal REJECTED (too short): {len(self.signal_samples)} samples ({duration_sec*1000:.2f}ms) < {self.min_duration_sec*1000:.2f}ms required")
-                    elif len(self.signal_samples) > self.max_duration_samples:
-                        flow.warning("ISM", f"[X] Signal REJECTED (too long): {len(self.signal_samples)} samples ({duration_sec*1000:.2f}ms) > {self.max_duration_sec*1000:.2f}ms max")
-                    else:
-                        # Valid duration - accept signal
-                        signal_array = np.array(self.signal_samples)
-                        peak_power = np.max(np.abs(signal_array) ** 2)
-                        # Apply same +40 dB offset as detection calculation
-                        peak_power_db = 10 * np.log10(peak_power + 1e-10) + 40.0
-
-                        fft = np.fft.fft(signal_array)
-                        fft_freqs = np.fft.fftfreq(len(signal_array), 1 / self.sample_rate)
-                        center_freq_offset = fft_freqs[np.argmax(np.abs(fft))]
-
-                        flow.success("ISM", f"[OK] Signal ACCEPTED: {len(self.signal_samples)} samples, {duration_sec*1000:.2f}ms, {peak_power_db:.1f} dB")
-
-                        detected_this_batch.append(
-                            {
-                                "start_sample": self.signal_start_sample,
-                                "duration_sec": duration_sec,
-                                "peak_power_dbm": peak_power_db,
-                                "center_freq_offset_hz": center_freq_offset,
-                            }
-                        )
-
-                    self.signal_samples = []
-        
+                self.signal_samples = []
+                self._signal_len = 0
+            # Callers may reuse iq_samples, so keep a copy of the open tail
+            tail = iq_samples[max(open_start, 0):].copy()
+            self.signal_samples.append(tail)
+            self._signal_len += len(tail)
+        self.in_signal = in_signal
+
         # Handle signal that extends to end of batch
         if self.in_signal:
             self.continuous_batch_count += 1
@@ -167,18 +235,19 @@ class SignalDetector:
             
             # If signal has spanned too many batches, it's continuous background noise - reject it
             if self.continuous_batch_count > self.max_continuous_batches:
-                flow.warning("ISM", f"[X] Signal REJECTED (continuous background): {len(self.signal_samples)} samples across {self.continuous_batch_count} batches")
+                flow.warning("ISM", f"[X] Signal REJECTED (continuous background): {self._signal_len} samples across {self.continuous_batch_count} batches")
                 # Reset and ignore this continuous signal
                 self.in_signal = False
                 self.signal_samples = []
+                self._signal_len = 0
                 self.samples_below_threshold = 0
                 self.continuous_batch_count = 0
                 # Enter cooldown period to avoid immediate re-detection (50 batches = ~25ms)
                 self.cooldown_batches = 50
                 flow.data("ISM", "cooldown_started", "50 batches (~25ms)")
-            else:
+            elif self.trace:
                 # Signal continues to next batch - keep accumulating
-                flow.data("ISM", "signal_continues", f"{len(self.signal_samples)} samples, batch {self.continuous_batch_count}")
+                flow.data("ISM", "signal_continues", f"{self._signal_len} samples, batch {self.continuous_batch_count}")
 
         return detected_this_batch
 
@@ -11,6 +11,8 @@ Provides:
 - Smoothing (Hanning, Hamming, etc.)
 """
 
+import functools
+
 import numpy as np
 from collections import deque
 from dataclasses import dataclass, field
@@ -29,6 +31,22 @@ WINDOW_FUNCTIONS = {
 }
 
 
+@functools.lru_cache(maxsize=16)
+def get_window(name: str, size: int) -> np.ndarray:
+    """Shared read-only float32 window, without gain compensation.
+
+    Unknown names fall back to hanning. Cached per (name, size), so the
+    SDR worker and the analyzer build each window once per process.
+    """
+    winfo = WINDOW_FUNCTIONS.get(name.lower(), WINDOW_FUNCTIONS["hanning"])
+    if winfo["func"] is None:
+        win = np.ones(size, dtype=np.float32)
+    else:
+        win = winfo["func"](size).astype(np.float32)
+    win.setflags(write=False)
+    return win
+
+
 @dataclass
 class SpectrumPeak:
     """Detected peak in the spectrum."""
@@ -114,18 +132,8 @@ class SpectrumAnalyzer:
 
     def _build_window(self, name: str, size: int) -> np.ndarray:
         """Build window function with gain compensation."""
-        name_lower = name.lower()
-        if name_lower not in WINDOW_FUNCTIONS:
-            name_lower = "hanning"
-
-        winfo = WINDOW_FUNCTIONS[name_lower]
-        if winfo["func"] is None:
-            # Rectangular window
-            return np.ones(size, dtype=np.float32)
-
-        win = winfo["func"](size).astype(np.float32)
-        win *= winfo["gain_compensation"]
-        return win
+        winfo = WINDOW_FUNCTIONS.get(name.lower(), WINDOW_FUNCTIONS["hanning"])
+        return get_window(name, size) * np.float32(winfo["gain_compensation"])
 
     def _compute_freq_axis(self) -> np.ndarray:
         """Compute frequency axis in Hz."""